@@ -121,6 +121,7 @@ impl Backtester {
         let mut orderbooks: HashMap<Symbol, OrderBook> = HashMap::new();
         let mut cash = self.config.trading.initial_capital;
         let mut peak_equity = self.config.trading.initial_capital;
+        let mut max_drawdown = 0.0_f64;
 
         // T+1 execution: queue of (symbol, order_id) to execute at next bar's open
         let mut t1_pending: Vec<(Symbol, u64)> = Vec::new();
@@ -142,6 +143,18 @@ impl Backtester {
         // Lookback window for indicators
         const LOOKBACK: usize = 300;
 
+        // Hoist config lookups used on every bar out of the hot loop
+        let use_t1_execution = self.config.backtest.use_t1_execution;
+        let slippage = self.config.exchange.assumed_slippage;
+        let taker_fee = self.config.exchange.taker_fee;
+
+        // Scratch price map reused across bars instead of allocating one per symbol per bar
+        let mut prices: HashMap<Symbol, f64> = HashMap::with_capacity(1);
+
+        // Likewise for the per-symbol open-order snapshot and completed-order sweep
+        let mut open_orders: Vec<Order> = Vec::new();
+        let mut completed_orders: Vec<u64> = Vec::new();
+
         // Main simulation loop
         for (bar_idx, current_date) in dates.iter().enumerate() {
             let start_idx = bar_idx.saturating_sub(LOOKBACK - 1);
@@ -149,7 +162,7 @@ impl Backtester {
             // ================================================================
             // PHASE 0 (T+1 only): Execute orders queued from previous day
             // ================================================================
-            if self.config.backtest.use_t1_execution && !t1_pending.is_empty() {
+            if use_t1_execution && !t1_pending.is_empty() {
                 for (symbol, order_id) in t1_pending.drain(..) {
                     if let Some((_, mtf_data)) = aligned.iter().find(|(s, _)| s == &symbol) {
                         let primary = mtf_data.primary();
@@ -161,14 +174,13 @@ impl Backtester {
                                     // Execute at open price with slippage
                                     let fill_price = candle.open
                                         * (1.0
-                                            + self.config.exchange.assumed_slippage
+                                            + slippage
                                                 * if order.side == Side::Buy { 1.0 } else { -1.0 });
 
                                     // Check if we have enough cash for buy orders (matches main branch)
                                     if order.side == Side::Buy {
                                         let position_value = fill_price * order.quantity.to_f64();
-                                        let commission =
-                                            position_value * self.config.exchange.taker_fee;
+                                        let commission = position_value * taker_fee;
                                         let cash_needed = position_value + commission;
                                         if cash < cash_needed {
                                             tracing::debug!(
@@ -268,8 +280,8 @@ impl Backtester {
                                             entry_levels.remove(&symbol);
                                             trailing_stops.remove(&symbol);
 
-                                            trades.push(trade.clone());
                                             self.strategy.on_trade_closed(&trade);
+                                            trades.push(trade);
                                         }
                                     }
 
@@ -317,7 +329,7 @@ impl Backtester {
                                     .map(|n| n.contains("Stop") || n.contains("Target"))
                                     .unwrap_or(false);
 
-                                if self.config.backtest.use_t1_execution && is_stop_or_target {
+                                if use_t1_execution && is_stop_or_target {
                                     tracing::debug!(
                                         "{} T+1 trigger: {:?} {} @ {:.2} ({}) - queuing for next day",
                                         candle.datetime.format("%Y-%m-%d"),
@@ -452,14 +464,11 @@ impl Backtester {
                     }
 
                     // Remove filled/cancelled orders
-                    let to_remove: Vec<u64> = orderbook
-                        .get_all_orders()
-                        .iter()
-                        .filter(|o| o.is_complete())
-                        .map(|o| o.id)
-                        .collect();
-
-                    for order_id in to_remove {
+                    completed_orders.clear();
+                    completed_orders
+                        .extend(orderbook.orders().filter(|o| o.is_complete()).map(|o| o.id));
+
+                    for &order_id in &completed_orders {
                         orderbook.cancel_order(order_id);
                     }
                 }
@@ -477,7 +486,7 @@ impl Backtester {
                 let price = candle.close;
 
                 // Update position unrealized P&L first (before borrowing position)
-                let mut prices = HashMap::new();
+                prices.clear();
                 prices.insert(symbol.clone(), price);
                 position_manager.update_unrealized_pnl(&prices);
 
@@ -595,7 +604,7 @@ impl Backtester {
                         );
 
                         // T+1 mode: Queue for next day execution
-                        if self.config.backtest.use_t1_execution {
+                        if use_t1_execution {
                             let order_id = close_order.id;
                             orderbooks
                                 .entry(symbol.clone())
@@ -652,8 +661,8 @@ impl Backtester {
 
                         // Execute immediate fill with slippage
                         let slippage_factor = match close_order.side {
-                            Side::Sell => 1.0 - self.config.exchange.assumed_slippage,
-                            Side::Buy => 1.0 + self.config.exchange.assumed_slippage,
+                            Side::Sell => 1.0 - slippage,
+                            Side::Buy => 1.0 + slippage,
                         };
 
                         let fill = self.execution_engine.execute_fill(
@@ -738,10 +747,10 @@ impl Backtester {
                 }
 
                 // Build strategy context
-                let open_orders: Vec<Order> = orderbooks
-                    .get(symbol)
-                    .map(|ob| ob.get_all_orders().into_iter().cloned().collect())
-                    .unwrap_or_default();
+                open_orders.clear();
+                if let Some(ob) = orderbooks.get(symbol) {
+                    open_orders.extend(ob.orders().cloned());
+                }
 
                 // Build strategy context
                 let mut mtf_view_storage;
@@ -863,7 +872,7 @@ impl Backtester {
                         // Using current_slice here matches main branch behavior
                         // NOTE: Only pre-cache if T+1 execution is enabled, otherwise let the
                         // lazy calculation handle it at position creation time
-                        if self.config.backtest.use_t1_execution {
+                        if use_t1_execution {
                             let stop = self.strategy.calculate_stop_loss(
                                 current_slice,
                                 price,
@@ -894,7 +903,7 @@ impl Backtester {
                     // This matches main branch behavior where signals are generated at CLOSE,
                     // but orders execute at next bar's OPEN
                     // NOTE: Both ENTRY and EXIT orders use T+1 to match main branch
-                    if self.config.backtest.use_t1_execution
+                    if use_t1_execution
                         && final_order.order_type == crate::oms::types::OrderType::Market
                     {
                         // Convert market order to limit order at next bar's open (will be filled immediately)
@@ -927,15 +936,15 @@ impl Backtester {
                     // This matches the behavior of signal-based backtesters
                     if final_order.order_type == crate::oms::types::OrderType::Market {
                         let slippage_factor = match final_order.side {
-                            Side::Buy => 1.0 + self.config.exchange.assumed_slippage,
-                            Side::Sell => 1.0 - self.config.exchange.assumed_slippage,
+                            Side::Buy => 1.0 + slippage,
+                            Side::Sell => 1.0 - slippage,
                         };
                         let fill_price = price * slippage_factor;
 
                         // Check if we have enough cash for buy orders (matches main branch)
                         if final_order.side == Side::Buy {
                             let position_value = fill_price * final_order.quantity.to_f64();
-                            let commission = position_value * self.config.exchange.taker_fee;
+                            let commission = position_value * taker_fee;
                             let cash_needed = position_value + commission;
                             if cash < cash_needed {
                                 tracing::debug!(
@@ -1064,10 +1073,11 @@ impl Backtester {
             self.risk_manager.update_capital(total_value);
             equity_curve.push((*current_date, total_value));
 
-            // Update peak equity for drawdown tracking
+            // Update peak equity and max drawdown as we go, so metrics need no extra pass
             if total_value > peak_equity {
                 peak_equity = total_value;
             }
+            max_drawdown = max_drawdown.max((peak_equity - total_value) / peak_equity);
         }
 
         // Close remaining positions and convert to trades
@@ -1097,7 +1107,7 @@ impl Backtester {
             }
         }
 
-        let metrics = self.calculate_metrics(&trades, &equity_curve, &primary_tf);
+        let metrics = self.calculate_metrics(&trades, &equity_curve, max_drawdown, &primary_tf);
         BacktestResult {
             trades,
             equity_curve,
@@ -1142,6 +1152,7 @@ impl Backtester {
         &self,
         trades: &[Trade],
         equity_curve: &[(DateTime<Utc>, f64)],
+        max_dd: f64,
         _timeframe: &str,
     ) -> PerformanceMetrics {
         if trades.is_empty() || equity_curve.is_empty() {
@@ -1152,18 +1163,36 @@ impl Backtester {
         let final_equity = equity_curve.last().unwrap().1;
         let total_return = ((final_equity - initial_capital) / initial_capital) * 100.0;
 
-        let winners: Vec<&Trade> = trades.iter().filter(|t| t.net_pnl.is_positive()).collect();
-        let losers: Vec<&Trade> = trades.iter().filter(|t| !t.net_pnl.is_positive()).collect();
+        // One pass over the trades: win/loss counts, totals and extremes, with each
+        // net P&L converted once and no intermediate winner/loser lists
+        let mut winners = 0usize;
+        let mut losers = 0usize;
+        let mut total_wins = 0.0;
+        let mut total_losses = 0.0;
+        let mut largest_win = 0.0_f64;
+        let mut largest_loss = 0.0_f64;
+        let mut total_commission = 0.0;
+
+        for trade in trades {
+            let pnl = trade.net_pnl.to_f64();
+            if pnl > 0.0 {
+                winners += 1;
+                total_wins += pnl;
+                largest_win = largest_win.max(pnl);
+            } else {
+                losers += 1;
+                total_losses += pnl.abs();
+                largest_loss = largest_loss.min(pnl);
+            }
+            total_commission += trade.commission.to_f64();
+        }
 
         let win_rate = if !trades.is_empty() {
-            (winners.len() as f64 / trades.len() as f64) * 100.0
+            (winners as f64 / trades.len() as f64) * 100.0
         } else {
             0.0
         };
 
-        let total_wins: f64 = winners.iter().map(|t| t.net_pnl.to_f64()).sum();
-        let total_losses: f64 = losers.iter().map(|t| t.net_pnl.abs().to_f64()).sum();
-
         let profit_factor = if total_losses > 0.0 {
             total_wins / total_losses
         } else if total_wins > 0.0 {
@@ -1172,41 +1201,34 @@ impl Backtester {
             0.0
         };
 
-        let avg_win = if !winners.is_empty() {
-            total_wins / winners.len() as f64
+        let avg_win = if winners > 0 {
+            total_wins / winners as f64
         } else {
             0.0
         };
 
-        let avg_loss = if !losers.is_empty() {
-            total_losses / losers.len() as f64
+        let avg_loss = if losers > 0 {
+            total_losses / losers as f64
         } else {
             0.0
         };
 
         let expectancy = (win_rate / 100.0) * avg_win - ((100.0 - win_rate) / 100.0) * avg_loss;
 
-        let largest_win = winners
-            .iter()
-            .map(|t| t.net_pnl.to_f64())
-            .fold(0.0, f64::max);
-        let largest_loss = losers
-            .iter()
-            .map(|t| t.net_pnl.to_f64())
-            .fold(0.0, f64::min);
-
-        let total_commission: f64 = trades.iter().map(|t| t.commission.to_f64()).sum();
-
-        // Sharpe ratio
-        let returns: Vec<f64> = equity_curve
-            .windows(2)
-            .map(|w| (w[1].1 - w[0].1) / w[0].1)
-            .collect();
+        // Sharpe ratio: streaming mean/variance of bar returns (Welford), no returns buffer
+        let mut n_returns = 0usize;
+        let mut mean = 0.0;
+        let mut m2 = 0.0;
+        for w in equity_curve.windows(2) {
+            let r = (w[1].1 - w[0].1) / w[0].1;
+            n_returns += 1;
+            let delta = r - mean;
+            mean += delta / n_returns as f64;
+            m2 += delta * (r - mean);
+        }
 
-        let sharpe = if returns.len() > 1 {
-            let mean = returns.iter().sum::<f64>() / returns.len() as f64;
-            let variance = returns.iter().map(|r| (r - mean).powi(2)).sum::<f64>()
-                / (returns.len() - 1) as f64;
+        let sharpe = if n_returns > 1 {
+            let variance = m2 / (n_returns - 1) as f64;
             let std = variance.sqrt();
 
             if std > 0.0 {
@@ -1220,21 +1242,7 @@ impl Backtester {
             0.0
         };
 
-        // Max drawdown
-        let mut peak = initial_capital;
-        let mut max_dd = 0.0;
-
-        for (_, equity) in equity_curve {
-            if *equity > peak {
-                peak = *equity;
-            }
-            let dd = (peak - equity) / peak;
-            if dd > max_dd {
-                max_dd = dd;
-            }
-        }
-
-        // Calmar ratio
+        // Calmar ratio (max drawdown is tracked while the equity curve is built)
         let calmar = if max_dd > 0.0 {
             let start = equity_curve.first().unwrap().0;
             let end = equity_curve.last().unwrap().0;
@@ -1268,8 +1276,8 @@ impl Backtester {
             profit_factor,
             expectancy,
             trades.len(),
-            winners.len(),
-            losers.len(),
+            winners,
+            losers,
             avg_win,
             avg_loss,
             largest_win,
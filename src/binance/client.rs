@@ -17,9 +17,13 @@
 
 use anyhow::{Context, Result};
 use chrono::{DateTime, Duration, Utc};
-use indicatif::{ProgressBar, ProgressStyle};
-use reqwest::Client;
+use indicatif::{MultiProgress, ProgressBar, ProgressStyle};
+use reqwest::{Client, StatusCode};
+use serde_json::value::RawValue;
+use std::sync::Arc;
 use std::time::Duration as StdDuration;
+use tokio::sync::Semaphore;
+use tokio::task::JoinSet;
 use tracing::{debug, info, warn};
 
 use super::types::{BinanceKline, SymbolMapping};
@@ -33,11 +37,84 @@ const MAX_KLINES_PER_REQUEST: u32 = 1000;
 /// Rate limit delay between requests (ms)
 const RATE_LIMIT_DELAY_MS: u64 = 100;
 
+/// Maximum kline requests in flight at once, shared by every clone of a client
+///
+/// Concurrent downloads share one client, so this caps the total load on the
+/// API rather than the load per symbol.
+const MAX_CONCURRENT_REQUESTS: usize = 5;
+
+/// Maximum retries for throttled (429) or server-error (5xx) responses
+const MAX_RETRIES: u32 = 5;
+
+/// Base backoff between retries (ms), doubled on each attempt
+const RETRY_BACKOFF_MS: u64 = 500;
+
+/// Build the shared HTTP client
+///
+/// Keeps connections alive between paginated requests so each page reuses
+/// the pooled TCP+TLS connection instead of re-handshaking.
+fn build_http_client() -> Client {
+    Client::builder()
+        .timeout(StdDuration::from_secs(30))
+        .pool_max_idle_per_host(16)
+        .pool_idle_timeout(StdDuration::from_secs(90))
+        .tcp_keepalive(StdDuration::from_secs(60))
+        .build()
+        .expect("Failed to create HTTP client")
+}
+
+/// Fixed width of an interval in milliseconds
+///
+/// Returns `None` for calendar intervals ("1M") whose width varies.
+fn interval_ms(interval: &str) -> Option<i64> {
+    const MINUTE: i64 = 60_000;
+    let minutes = match interval {
+        "1m" => 1,
+        "3m" => 3,
+        "5m" => 5,
+        "15m" => 15,
+        "30m" => 30,
+        "1h" => 60,
+        "2h" => 120,
+        "4h" => 240,
+        "6h" => 360,
+        "8h" => 480,
+        "12h" => 720,
+        "1d" => 1440,
+        "3d" => 4320,
+        "1w" => 10080,
+        _ => return None,
+    };
+    Some(minutes * MINUTE)
+}
+
+/// Append a page of klines, dropping rows that overlap what is already stored
+///
+/// Binance returns each page sorted by open time, so trimming the boundary
+/// keeps the full history sorted and unique without a final sort + dedup.
+fn append_page(all_klines: &mut Vec<BinanceKline>, page: Vec<BinanceKline>) {
+    match all_klines.last().map(|k| k.open_time) {
+        Some(last) => all_klines.extend(page.into_iter().filter(|k| k.open_time > last)),
+        None => all_klines.extend(page),
+    }
+}
+
+/// Parse a `Retry-After` header value given in seconds
+fn parse_retry_after(value: Option<&str>) -> Option<StdDuration> {
+    value
+        .and_then(|v| v.trim().parse::<u64>().ok())
+        .map(StdDuration::from_secs)
+}
+
 /// Binance API client
 #[derive(Debug, Clone)]
 pub struct BinanceClient {
     client: Client,
     symbol_mapping: SymbolMapping,
+    /// Client-wide request limit (clones share the permits)
+    requests: Arc<Semaphore>,
+    /// Draw target for concurrent downloads' progress bars
+    progress: MultiProgress,
 }
 
 impl Default for BinanceClient {
@@ -49,27 +126,16 @@ impl Default for BinanceClient {
 impl BinanceClient {
     /// Create a new Binance client
     pub fn new() -> Self {
-        let client = Client::builder()
-            .timeout(StdDuration::from_secs(30))
-            .build()
-            .expect("Failed to create HTTP client");
-
-        BinanceClient {
-            client,
-            symbol_mapping: SymbolMapping::default(),
-        }
+        Self::with_mapping(SymbolMapping::default())
     }
 
     /// Create with custom symbol mapping
     pub fn with_mapping(symbol_mapping: SymbolMapping) -> Self {
-        let client = Client::builder()
-            .timeout(StdDuration::from_secs(30))
-            .build()
-            .expect("Failed to create HTTP client");
-
         BinanceClient {
-            client,
+            client: build_http_client(),
             symbol_mapping,
+            requests: Arc::new(Semaphore::new(MAX_CONCURRENT_REQUESTS)),
+            progress: MultiProgress::new(),
         }
     }
 
@@ -124,29 +190,69 @@ impl BinanceClient {
             symbol, interval, limit
         );
 
-        let response = self
-            .client
-            .get(&url)
-            .query(&params)
-            .send()
-            .await
-            .context("Failed to send request to Binance")?;
+        let mut attempt = 0;
+        let response = loop {
+            let response = self
+                .client
+                .get(&url)
+                .query(&params)
+                .send()
+                .await
+                .context("Failed to send request to Binance")?;
 
-        if !response.status().is_success() {
             let status = response.status();
-            let body = response.text().await.unwrap_or_default();
-            anyhow::bail!("Binance API error {}: {}", status, body);
-        }
+            if status.is_success() {
+                break response;
+            }
+
+            // Retry throttling and transient server errors, honouring Retry-After
+            let retryable = status == StatusCode::TOO_MANY_REQUESTS || status.is_server_error();
+            if !retryable || attempt >= MAX_RETRIES {
+                let body = response.text().await.unwrap_or_default();
+                anyhow::bail!("Binance API error {}: {}", status, body);
+            }
 
-        let raw_data: Vec<Vec<serde_json::Value>> = response
-            .json()
+            let delay = parse_retry_after(
+                response
+                    .headers()
+                    .get(reqwest::header::RETRY_AFTER)
+                    .and_then(|v| v.to_str().ok()),
+            )
+            .unwrap_or_else(|| StdDuration::from_millis(RETRY_BACKOFF_MS << attempt));
+            attempt += 1;
+
+            warn!(
+                "Binance API returned {} (retry {}/{}), waiting {}ms",
+                status,
+                attempt,
+                MAX_RETRIES,
+                delay.as_millis()
+            );
+            tokio::time::sleep(delay).await;
+        };
+
+        // Split the page into borrowed raw rows (no `Value` tree), then parse each row
+        // on its own so a malformed row is skipped rather than failing (and
+        // truncating the history at) the whole page
+        let body = response
+            .bytes()
             .await
-            .context("Failed to parse Binance response")?;
+            .context("Failed to read Binance response")?;
+        let rows: Vec<&RawValue> =
+            serde_json::from_slice(&body).context("Failed to parse Binance response")?;
 
-        let klines: Vec<BinanceKline> = raw_data
+        let klines: Vec<BinanceKline> = rows
             .iter()
             .filter_map(|row| BinanceKline::from_raw(row))
             .collect();
+        if klines.len() < rows.len() {
+            warn!(
+                "Skipped {} malformed kline rows for {} {}",
+                rows.len() - klines.len(),
+                symbol,
+                interval
+            );
+        }
 
         Ok(klines)
     }
@@ -163,19 +269,38 @@ impl BinanceClient {
         interval: &str,
         days_back: u32,
     ) -> Result<Vec<BinanceKline>> {
-        let binance_symbol = self.to_binance_pair(symbol);
-
-        let end_time = Utc::now().timestamp_millis();
-        let start_time = (Utc::now() - Duration::days(days_back as i64)).timestamp_millis();
+        let now = Utc::now();
+        let end_time = now.timestamp_millis();
+        let start_time = (now - Duration::days(days_back as i64)).timestamp_millis();
 
         info!(
             "Fetching {} {} data from Binance ({} days back)",
-            binance_symbol, interval, days_back
+            self.to_binance_pair(symbol),
+            interval,
+            days_back
         );
 
+        self.fetch_range(symbol, interval, start_time, end_time)
+            .await
+    }
+
+    /// Fetch all klines with open time in `[start_time, end_time)` (milliseconds)
+    ///
+    /// Fails if any page request fails, rather than returning a truncated history.
+    pub async fn fetch_range(
+        &self,
+        symbol: &str,
+        interval: &str,
+        start_time: i64,
+        end_time: i64,
+    ) -> Result<Vec<BinanceKline>> {
+        let binance_symbol = self.to_binance_pair(symbol);
+
         // Estimate total candles for progress bar
-        let estimated_candles = Self::estimate_candles(interval, days_back);
-        let progress = ProgressBar::new(estimated_candles);
+        let estimated_candles = Self::estimate_candles(interval, end_time - start_time);
+        // Registered with the shared MultiProgress so concurrent downloads
+        // each get their own line instead of overwriting one another
+        let progress = self.progress.add(ProgressBar::new(estimated_candles));
         progress.set_style(
             ProgressStyle::default_bar()
                 .template("    [{bar:40.cyan/blue}] {pos}/{len} candles ({percent}%)")
@@ -183,49 +308,35 @@ impl BinanceClient {
                 .progress_chars("=>-"),
         );
 
-        let mut all_klines = Vec::new();
-        let mut current_start = start_time;
-
-        while current_start < end_time {
-            match self
-                .get_klines(
+        let all_klines = match interval_ms(interval) {
+            Some(step_ms) => {
+                self.fetch_pages_concurrent(
                     &binance_symbol,
                     interval,
-                    Some(current_start),
-                    Some(end_time),
-                    Some(MAX_KLINES_PER_REQUEST),
+                    start_time,
+                    end_time,
+                    step_ms,
+                    &progress,
                 )
                 .await
-            {
-                Ok(klines) => {
-                    if klines.is_empty() {
-                        break;
-                    }
-
-                    // Move start time to after last candle
-                    if let Some(last) = klines.last() {
-                        current_start = last.open_time + 1;
-                    }
-
-                    let batch_size = klines.len() as u64;
-                    all_klines.extend(klines);
-                    progress.inc(batch_size);
-
-                    // Rate limiting
-                    tokio::time::sleep(StdDuration::from_millis(RATE_LIMIT_DELAY_MS)).await;
-                }
-                Err(e) => {
-                    warn!("Error fetching klines: {}", e);
-                    break;
-                }
             }
-        }
+            None => {
+                // Size the output once up front; one extra page absorbs estimate slack
+                let capacity = estimated_candles as usize + MAX_KLINES_PER_REQUEST as usize;
+                self.fetch_pages_sequential(
+                    &binance_symbol,
+                    interval,
+                    start_time,
+                    end_time,
+                    &progress,
+                    capacity,
+                )
+                .await
+            }
+        };
 
         progress.finish_and_clear();
-
-        // Sort and deduplicate
-        all_klines.sort_by_key(|k| k.open_time);
-        all_klines.dedup_by_key(|k| k.open_time);
+        let all_klines = all_klines?;
 
         info!(
             "Fetched {} candles for {} {}",
@@ -237,28 +348,135 @@ impl BinanceClient {
         Ok(all_klines)
     }
 
-    /// Estimate the number of candles for a given interval and days
-    fn estimate_candles(interval: &str, days: u32) -> u64 {
-        let minutes_per_candle = match interval {
-            "1m" => 1,
-            "3m" => 3,
-            "5m" => 5,
-            "15m" => 15,
-            "30m" => 30,
-            "1h" => 60,
-            "2h" => 120,
-            "4h" => 240,
-            "6h" => 360,
-            "8h" => 480,
-            "12h" => 720,
-            "1d" => 1440,
-            "3d" => 4320,
-            "1w" => 10080,
-            "1M" => 43200,
-            _ => 60, // Default to 1h
-        };
-        let total_minutes = days as u64 * 24 * 60;
-        total_minutes / minutes_per_candle
+    /// Fetch all pages concurrently for fixed-width intervals
+    ///
+    /// Page boundaries are known up front (`MAX_KLINES_PER_REQUEST` candles each),
+    /// so requests overlap instead of waiting on each other's round trip.
+    async fn fetch_pages_concurrent(
+        &self,
+        symbol: &str,
+        interval: &str,
+        start_time: i64,
+        end_time: i64,
+        interval_ms: i64,
+        progress: &ProgressBar,
+    ) -> Result<Vec<BinanceKline>> {
+        let page_span = interval_ms * MAX_KLINES_PER_REQUEST as i64;
+        let page_starts: Vec<i64> = (start_time..end_time).step_by(page_span as usize).collect();
+
+        let mut set = JoinSet::new();
+
+        for (idx, page_start) in page_starts.iter().copied().enumerate() {
+            let client = self.clone();
+            let symbol = symbol.to_string();
+            let interval = interval.to_string();
+            let page_end = (page_start + page_span - 1).min(end_time);
+
+            set.spawn(async move {
+                let _permit = client.requests.acquire().await;
+                let result = client
+                    .get_klines(
+                        &symbol,
+                        &interval,
+                        Some(page_start),
+                        Some(page_end),
+                        Some(MAX_KLINES_PER_REQUEST),
+                    )
+                    .await;
+
+                // Rate limiting (permit is held, so this spaces requests per slot)
+                tokio::time::sleep(StdDuration::from_millis(RATE_LIMIT_DELAY_MS)).await;
+                (idx, result)
+            });
+        }
+
+        let mut pages: Vec<Option<Result<Vec<BinanceKline>>>> =
+            (0..page_starts.len()).map(|_| None).collect();
+
+        while let Some(joined) = set.join_next().await {
+            match joined {
+                Ok((idx, result)) => {
+                    if let Ok(klines) = &result {
+                        progress.inc(klines.len() as u64);
+                    }
+                    pages[idx] = Some(result);
+                }
+                Err(e) => warn!("Kline page task failed: {}", e),
+            }
+        }
+
+        // Stitch pages in order; any failed page fails the fetch, so callers never
+        // mistake a partial or empty history for "no new candles"
+        // Every page holds at most MAX_KLINES_PER_REQUEST candles, so this never regrows
+        let page_count = pages.len();
+        let mut all_klines =
+            Vec::with_capacity(page_starts.len() * MAX_KLINES_PER_REQUEST as usize);
+        for (idx, page) in pages.into_iter().enumerate() {
+            let klines = page.context("Kline page task aborted")?.with_context(|| {
+                format!("Failed to fetch kline page {}/{}", idx + 1, page_count)
+            })?;
+            append_page(&mut all_klines, klines);
+        }
+
+        Ok(all_klines)
+    }
+
+    /// Fetch pages one after another, following the last returned open time
+    ///
+    /// Used for calendar intervals where page boundaries can't be precomputed.
+    async fn fetch_pages_sequential(
+        &self,
+        symbol: &str,
+        interval: &str,
+        start_time: i64,
+        end_time: i64,
+        progress: &ProgressBar,
+        capacity: usize,
+    ) -> Result<Vec<BinanceKline>> {
+        let mut all_klines = Vec::with_capacity(capacity);
+        let mut current_start = start_time;
+
+        while current_start < end_time {
+            // Held through the rate-limit sleep, like a concurrent page's permit
+            let _permit = self.requests.acquire().await;
+            let klines = self
+                .get_klines(
+                    symbol,
+                    interval,
+                    Some(current_start),
+                    Some(end_time),
+                    Some(MAX_KLINES_PER_REQUEST),
+                )
+                .await
+                .context("Failed to fetch kline page")?;
+            if klines.is_empty() {
+                break;
+            }
+
+            // Move start time to after last candle
+            if let Some(last) = klines.last() {
+                current_start = last.open_time + 1;
+            }
+
+            let batch_size = klines.len() as u64;
+            append_page(&mut all_klines, klines);
+            progress.inc(batch_size);
+
+            // Rate limiting
+            tokio::time::sleep(StdDuration::from_millis(RATE_LIMIT_DELAY_MS)).await;
+        }
+
+        Ok(all_klines)
+    }
+
+    /// Estimate the number of candles an interval yields over `span_ms` milliseconds
+    fn estimate_candles(interval: &str, span_ms: i64) -> u64 {
+        const HOUR_MS: i64 = 3_600_000;
+        let step_ms = interval_ms(interval).unwrap_or(match interval {
+            "1M" => 720 * HOUR_MS, // ~30 days
+            _ => HOUR_MS,          // Default to 1h
+        });
+        (span_ms.max(0) / step_ms) as u64
     }
 
     /// Check server connectivity
@@ -294,4 +512,63 @@ mod tests {
         assert_eq!(client.to_binance_pair("BTC"), "BTCUSDT");
         assert_eq!(client.to_binance_pair("BTCINR"), "BTCUSDT");
     }
+
+    #[test]
+    fn test_interval_ms() {
+        assert_eq!(interval_ms("1m"), Some(60_000));
+        assert_eq!(interval_ms("4h"), Some(4 * 3_600_000));
+        assert_eq!(interval_ms("1d"), Some(86_400_000));
+        assert_eq!(interval_ms("1M"), None);
+    }
+
+    #[test]
+    fn test_estimate_candles() {
+        const DAY_MS: i64 = 86_400_000;
+        assert_eq!(BinanceClient::estimate_candles("1h", DAY_MS), 24);
+        assert_eq!(BinanceClient::estimate_candles("5m", DAY_MS), 288);
+        assert_eq!(BinanceClient::estimate_candles("1d", 365 * DAY_MS), 365);
+        assert_eq!(BinanceClient::estimate_candles("1M", 360 * DAY_MS), 12);
+        assert_eq!(BinanceClient::estimate_candles("1h", -DAY_MS), 0);
+    }
+
+    #[test]
+    fn test_parse_retry_after() {
+        assert_eq!(
+            parse_retry_after(Some("3")),
+            Some(StdDuration::from_secs(3))
+        );
+        assert_eq!(
+            parse_retry_after(Some(" 10 ")),
+            Some(StdDuration::from_secs(10))
+        );
+        assert_eq!(parse_retry_after(Some("soon")), None);
+        assert_eq!(parse_retry_after(None), None);
+    }
+
+    fn kline(open_time: i64) -> BinanceKline {
+        BinanceKline {
+            open_time,
+            open: 1.0,
+            high: 1.0,
+            low: 1.0,
+            close: 1.0,
+            volume: 1.0,
+            close_time: open_time + 59_999,
+            quote_volume: 1.0,
+            trades: 1,
+            taker_buy_base: 0.5,
+            taker_buy_quote: 0.5,
+        }
+    }
+
+    #[test]
+    fn test_append_page_trims_overlap() {
+        let mut all = Vec::new();
+        append_page(&mut all, vec![kline(0), kline(60_000), kline(120_000)]);
+        append_page(&mut all, vec![kline(120_000), kline(180_000)]);
+        append_page(&mut all, Vec::new());
+
+        let times: Vec<i64> = all.iter().map(|k| k.open_time).collect();
+        assert_eq!(times, vec![0, 60_000, 120_000, 180_000]);
+    }
 }
@@ -1,6 +1,9 @@
 //! Binance API types for klines (candlestick) data
 
+use serde::de::{self, Deserializer, IgnoredAny, SeqAccess, Visitor};
 use serde::{Deserialize, Serialize};
+use serde_json::value::RawValue;
+use std::fmt;
 
 /// Binance kline/candlestick data
 /// API returns an array: [open_time, open, high, low, close, volume, close_time,
@@ -21,25 +24,102 @@ pub struct BinanceKline {
 }
 
 impl BinanceKline {
-    /// Parse from raw JSON array returned by Binance API
-    pub fn from_raw(raw: &[serde_json::Value]) -> Option<Self> {
-        if raw.len() < 11 {
-            return None;
+    /// Parse one raw row of a klines response, `None` if the row is malformed
+    ///
+    /// Lets callers skip a bad row instead of failing the whole page.
+    pub fn from_raw(raw: &RawValue) -> Option<Self> {
+        serde_json::from_str(raw.get()).ok()
+    }
+}
+
+/// Deserialize from the kline array, parsing the quoted numeric fields in place
+impl<'de> Deserialize<'de> for BinanceKline {
+    fn deserialize<D>(deserializer: D) -> Result<Self, D::Error>
+    where
+        D: Deserializer<'de>,
+    {
+        deserializer.deserialize_seq(KlineVisitor)
+    }
+}
+
+struct KlineVisitor;
+
+impl<'de> Visitor<'de> for KlineVisitor {
+    type Value = BinanceKline;
+
+    fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {
+        f.write_str("a Binance kline array")
+    }
+
+    fn visit_seq<A>(self, mut seq: A) -> Result<Self::Value, A::Error>
+    where
+        A: SeqAccess<'de>,
+    {
+        let kline = BinanceKline {
+            open_time: next_field(&mut seq, 0)?,
+            open: next_field::<_, StrF64>(&mut seq, 1)?.0,
+            high: next_field::<_, StrF64>(&mut seq, 2)?.0,
+            low: next_field::<_, StrF64>(&mut seq, 3)?.0,
+            close: next_field::<_, StrF64>(&mut seq, 4)?.0,
+            volume: next_field::<_, StrF64>(&mut seq, 5)?.0,
+            close_time: next_field(&mut seq, 6)?,
+            quote_volume: next_field::<_, StrF64>(&mut seq, 7)?.0,
+            trades: next_field(&mut seq, 8)?,
+            taker_buy_base: next_field::<_, StrF64>(&mut seq, 9)?.0,
+            taker_buy_quote: next_field::<_, StrF64>(&mut seq, 10)?.0,
+        };
+
+        // Skip the trailing "ignore" field and anything Binance appends later
+        while seq.next_element::<IgnoredAny>()?.is_some() {}
+
+        Ok(kline)
+    }
+}
+
+fn next_field<'de, A, T>(seq: &mut A, idx: usize) -> Result<T, A::Error>
+where
+    A: SeqAccess<'de>,
+    T: Deserialize<'de>,
+{
+    seq.next_element()?
+        .ok_or_else(|| de::Error::invalid_length(idx, &"at least 11 kline fields"))
+}
+
+/// Numeric field sent by Binance as a JSON string (e.g. "42000.50")
+struct StrF64(f64);
+
+impl<'de> Deserialize<'de> for StrF64 {
+    fn deserialize<D>(deserializer: D) -> Result<Self, D::Error>
+    where
+        D: Deserializer<'de>,
+    {
+        struct StrF64Visitor;
+
+        impl Visitor<'_> for StrF64Visitor {
+            type Value = f64;
+
+            fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {
+                f.write_str("a number or numeric string")
+            }
+
+            fn visit_str<E: de::Error>(self, v: &str) -> Result<f64, E> {
+                v.parse().map_err(E::custom)
+            }
+
+            fn visit_f64<E: de::Error>(self, v: f64) -> Result<f64, E> {
+                Ok(v)
+            }
+
+            fn visit_i64<E: de::Error>(self, v: i64) -> Result<f64, E> {
+                Ok(v as f64)
+            }
+
+            fn visit_u64<E: de::Error>(self, v: u64) -> Result<f64, E> {
+                Ok(v as f64)
+            }
         }
 
-        Some(BinanceKline {
-            open_time: raw[0].as_i64()?,
-            open: raw[1].as_str()?.parse().ok()?,
-            high: raw[2].as_str()?.parse().ok()?,
-            low: raw[3].as_str()?.parse().ok()?,
-            close: raw[4].as_str()?.parse().ok()?,
-            volume: raw[5].as_str()?.parse().ok()?,
-            close_time: raw[6].as_i64()?,
-            quote_volume: raw[7].as_str()?.parse().ok()?,
-            trades: raw[8].as_u64()?,
-            taker_buy_base: raw[9].as_str()?.parse().ok()?,
-            taker_buy_quote: raw[10].as_str()?.parse().ok()?,
-        })
+        deserializer.deserialize_any(StrF64Visitor).map(StrF64)
     }
 }
 
@@ -120,6 +200,41 @@ mod tests {
         assert_eq!(mapping.to_binance_pair("UNKNOWN"), "UNKNOWNUSDT");
     }
 
+    #[test]
+    fn test_kline_deserialize() {
+        let json = r#"[[1499040000000,"0.01634790","0.80000000","0.01575800","0.01577100",
+            "148976.11427815",1499644799999,"2434.19055334",308,"1756.87402397",
+            "28.46694368","0"]]"#;
+
+        let klines: Vec<BinanceKline> = serde_json::from_str(json).unwrap();
+        assert_eq!(klines.len(), 1);
+
+        let k = &klines[0];
+        assert_eq!(k.open_time, 1499040000000);
+        assert_eq!(k.open, 0.0163479);
+        assert_eq!(k.close, 0.015771);
+        assert_eq!(k.close_time, 1499644799999);
+        assert_eq!(k.trades, 308);
+        assert_eq!(k.taker_buy_quote, 28.46694368);
+
+        let short = r#"[1499040000000,"0.01634790"]"#;
+        assert!(serde_json::from_str::<BinanceKline>(short).is_err());
+    }
+
+    #[test]
+    fn test_from_raw_skips_malformed_rows() {
+        let json = r#"[[1499040000000,"1.0","2.0","0.5","1.5","10.0",1499043599999,"15.0",3,"5.0","7.5","0"],
+            [1499043600000,"oops","2.0","0.5","1.5","10.0",1499047199999,"15.0",3,"5.0","7.5","0"],
+            [1499047200000,"1.5","2.5","1.0","2.0","12.0",1499050799999,"24.0",4,"6.0","12.0","0"]]"#;
+
+        let rows: Vec<&RawValue> = serde_json::from_str(json).unwrap();
+        let klines: Vec<BinanceKline> = rows.iter().filter_map(BinanceKline::from_raw).collect();
+
+        assert_eq!(klines.len(), 2);
+        assert_eq!(klines[0].open_time, 1499040000000);
+        assert_eq!(klines[1].open_time, 1499047200000);
+    }
+
     #[test]
     fn test_valid_intervals() {
         assert!(is_valid_interval("1h"));
@@ -51,29 +51,48 @@ fn constant_time_eq(a: &[u8], b: &[u8]) -> bool {
     result == 0
 }
 
+/// HMAC state already keyed with the API secret, cloned for each signature
+#[derive(Clone)]
+struct SigningKey(HmacSha256);
+
+impl std::fmt::Debug for SigningKey {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str("SigningKey(..)")
+    }
+}
+
 /// API credentials container
 #[derive(Debug, Clone)]
 pub struct Credentials {
     api_key: String,
     api_secret: String,
+    signing_key: SigningKey,
 }
 
 impl Credentials {
     /// Create new credentials from API key and secret
     pub fn new(api_key: impl Into<String>, api_secret: impl Into<String>) -> Self {
+        let api_secret = api_secret.into();
+        let signing_key = SigningKey(
+            HmacSha256::new_from_slice(api_secret.as_bytes())
+                .expect("HMAC can take key of any size"),
+        );
+
         Self {
             api_key: api_key.into(),
-            api_secret: api_secret.into(),
+            api_secret,
+            signing_key,
         }
     }
 
     /// Create credentials from environment variables
     ///
-    /// Looks for `COINDCX_API_KEY` and `COINDCX_API_SECRET`
+    /// Looks for `COINDCX_API_KEY` and `COINDCX_API_SECRET` (read once per process)
     pub fn from_env() -> Result<Self, std::env::VarError> {
-        let api_key = std::env::var("COINDCX_API_KEY")?;
-        let api_secret = std::env::var("COINDCX_API_SECRET")?;
-        Ok(Self::new(api_key, api_secret))
+        match crate::config::env_credentials() {
+            (Some(api_key), Some(api_secret)) => Ok(Self::new(api_key.clone(), api_secret.clone())),
+            _ => Err(std::env::VarError::NotPresent),
+        }
     }
 
     /// Get the API key
@@ -87,8 +106,12 @@ impl Credentials {
     }
 
     /// Sign a request body
+    ///
+    /// Starts from the pre-keyed HMAC state instead of re-deriving the key per request.
     pub fn sign(&self, body: &str) -> String {
-        sign_request(body, &self.api_secret)
+        let mut mac = self.signing_key.0.clone();
+        mac.update(body.as_bytes());
+        hex::encode(mac.finalize().into_bytes())
     }
 }
 
@@ -185,6 +208,18 @@ mod tests {
         assert_eq!(sig1, sig2);
     }
 
+    #[test]
+    fn test_credentials_sign_reuses_key() {
+        let creds = Credentials::new("my_key", "my_secret");
+        let body1 = r#"{"timestamp":1234567890}"#;
+        let body2 = r#"{"timestamp":1234567891}"#;
+
+        // Signing must not carry state from one body into the next
+        assert_eq!(creds.sign(body1), sign_request(body1, "my_secret"));
+        assert_eq!(creds.sign(body2), sign_request(body2, "my_secret"));
+        assert_eq!(creds.sign(body1), sign_request(body1, "my_secret"));
+    }
+
     #[test]
     fn test_constant_time_eq() {
         assert!(constant_time_eq(b"hello", b"hello"));
@@ -32,12 +32,13 @@
 
 use anyhow::{anyhow, Context, Result};
 use reqwest::Client;
+use std::fmt::Write as _;
 use std::sync::Arc;
 use std::time::Duration;
 use tokio::sync::Mutex;
 use tokio::time::sleep;
 
-use super::auth::{sign_request, Credentials};
+use super::auth::Credentials;
 use super::types::*;
 use crate::common::{CircuitBreaker, CircuitBreakerConfig, RateLimiter, RateLimiterConfig};
 
@@ -47,6 +48,9 @@ pub const API_BASE_URL: &str = "https://api.coindcx.com";
 /// Base URL for public market data endpoints
 pub const PUBLIC_BASE_URL: &str = "https://public.coindcx.com";
 
+/// Upper bound on a single retry backoff
+const MAX_RETRY_BACKOFF: Duration = Duration::from_secs(30);
+
 /// Convert simple symbol (e.g., "BTCINR") to CoinDCX pair format (e.g., "I-BTC_INR")
 ///
 /// CoinDCX uses different formats:
@@ -156,6 +160,7 @@ impl CoinDCXClient {
             .timeout(config.timeout)
             .pool_max_idle_per_host(10)
             .pool_idle_timeout(Duration::from_secs(90))
+            .tcp_keepalive(Duration::from_secs(60))
             .build()
             .expect("Failed to build HTTP client");
 
@@ -202,8 +207,8 @@ impl CoinDCXClient {
 
         for attempt in 0..=self.max_retries {
             if attempt > 0 {
-                // Exponential backoff: 1s, 2s, 4s, 8s...
-                let delay = Duration::from_secs(2u64.pow(attempt - 1));
+                // Jittered exponential backoff: up to 1s, 2s, 4s, 8s... capped
+                let delay = retry_backoff(attempt);
                 tracing::debug!("Retrying after {}ms", delay.as_millis());
                 sleep(delay).await;
             }
@@ -244,7 +249,7 @@ impl CoinDCXClient {
     {
         let url = format!("{}{}", API_BASE_URL, endpoint);
         let json_body = serde_json::to_string(body)?;
-        let signature = sign_request(&json_body, self.credentials.api_secret());
+        let signature = self.credentials.sign(&json_body);
 
         let response = self
             .http_client
@@ -273,7 +278,7 @@ impl CoinDCXClient {
     pub async fn get_all_tickers(&self) -> Result<Vec<Ticker>> {
         self.execute_with_retry(|| {
             let url = format!("{}/exchange/ticker", API_BASE_URL);
-            let client = self.http_client.clone();
+            let client = &self.http_client;
 
             async move {
                 let response = client
@@ -282,46 +287,30 @@ impl CoinDCXClient {
                     .await
                     .context("Failed to fetch tickers")?;
 
-                let text = response.text().await.context("Failed to read response")?;
-                serde_json::from_str(&text).context("Failed to parse tickers")
+                let body = response.bytes().await.context("Failed to read response")?;
+                serde_json::from_slice(&body).context("Failed to parse tickers")
             }
         })
         .await
     }
 
     /// Get ticker information for a specific market
+    ///
+    /// The endpoint only returns the full list. A market missing from it fails at
+    /// once instead of being retried as a request failure.
     pub async fn get_ticker(&self, symbol: &str) -> Result<Ticker> {
-        let symbol = symbol.to_string();
-        self.execute_with_retry(|| {
-            let url = format!("{}/exchange/ticker", API_BASE_URL);
-            let client = self.http_client.clone();
-            let symbol = symbol.clone();
-
-            async move {
-                let response = client
-                    .get(&url)
-                    .send()
-                    .await
-                    .context("Failed to fetch ticker")?;
-
-                let text = response.text().await.context("Failed to read response")?;
-                let tickers: Vec<Ticker> =
-                    serde_json::from_str(&text).context("Failed to parse ticker JSON")?;
-
-                tickers
-                    .into_iter()
-                    .find(|t| t.market == symbol)
-                    .ok_or_else(|| anyhow!("Ticker not found for {}", symbol))
-            }
-        })
-        .await
+        self.get_all_tickers()
+            .await?
+            .into_iter()
+            .find(|t| t.market == symbol)
+            .ok_or_else(|| anyhow!("Ticker not found for {}", symbol))
     }
 
     /// Get list of all available markets
     pub async fn get_markets(&self) -> Result<Vec<String>> {
         self.execute_with_retry(|| {
             let url = format!("{}/exchange/v1/markets", API_BASE_URL);
-            let client = self.http_client.clone();
+            let client = &self.http_client;
 
             async move {
                 let response = client
@@ -330,8 +319,8 @@ impl CoinDCXClient {
                     .await
                     .context("Failed to fetch markets")?;
 
-                let text = response.text().await.context("Failed to read response")?;
-                serde_json::from_str(&text).context("Failed to parse markets")
+                let body = response.bytes().await.context("Failed to read response")?;
+                serde_json::from_slice(&body).context("Failed to parse markets")
             }
         })
         .await
@@ -341,7 +330,7 @@ impl CoinDCXClient {
     pub async fn get_markets_details(&self) -> Result<Vec<MarketDetails>> {
         self.execute_with_retry(|| {
             let url = format!("{}/exchange/v1/markets_details", API_BASE_URL);
-            let client = self.http_client.clone();
+            let client = &self.http_client;
 
             async move {
                 let response = client
@@ -350,8 +339,8 @@ impl CoinDCXClient {
                     .await
                     .context("Failed to fetch market details")?;
 
-                let text = response.text().await.context("Failed to read response")?;
-                serde_json::from_str(&text).context("Failed to parse market details")
+                let body = response.bytes().await.context("Failed to read response")?;
+                serde_json::from_slice(&body).context("Failed to parse market details")
             }
         })
         .await
@@ -366,7 +355,7 @@ impl CoinDCXClient {
                 PUBLIC_BASE_URL,
                 pair.clone()
             );
-            let client = self.http_client.clone();
+            let client = &self.http_client;
 
             async move {
                 let response = client
@@ -375,8 +364,8 @@ impl CoinDCXClient {
                     .await
                     .context("Failed to fetch orderbook")?;
 
-                let text = response.text().await.context("Failed to read response")?;
-                serde_json::from_str(&text).context("Failed to parse orderbook")
+                let body = response.bytes().await.context("Failed to read response")?;
+                serde_json::from_slice(&body).context("Failed to parse orderbook")
             }
         })
         .await
@@ -394,30 +383,29 @@ impl CoinDCXClient {
         interval: &str,
         limit: Option<u32>,
     ) -> Result<Vec<Candle>> {
-        // Auto-convert symbol to CoinDCX pair format
-        let pair = symbol_to_pair(symbol);
-        let interval = interval.to_string();
+        // Auto-convert symbol to CoinDCX pair format; the URL is the same for every attempt
+        let mut url = format!(
+            "{}/market_data/candles?pair={}&interval={}",
+            PUBLIC_BASE_URL,
+            symbol_to_pair(symbol),
+            interval
+        );
+        if let Some(l) = limit {
+            let _ = write!(url, "&limit={}", l);
+        }
         self.execute_with_retry(|| {
-            let mut url = format!(
-                "{}/market_data/candles?pair={}&interval={}",
-                PUBLIC_BASE_URL,
-                pair.clone(),
-                interval.clone()
-            );
-            if let Some(l) = limit {
-                url.push_str(&format!("&limit={}", l));
-            }
-            let client = self.http_client.clone();
+            let url = url.as_str();
+            let client = &self.http_client;
 
             async move {
                 let response = client
-                    .get(&url)
+                    .get(url)
                     .send()
                     .await
                     .context("Failed to fetch candles")?;
 
-                let text = response.text().await.context("Failed to read response")?;
-                serde_json::from_str(&text).context("Failed to parse candles")
+                let body = response.bytes().await.context("Failed to read response")?;
+                serde_json::from_slice(&body).context("Failed to parse candles")
             }
         })
         .await
@@ -431,9 +419,8 @@ impl CoinDCXClient {
         self.execute_with_retry(|| {
             let endpoint = "/exchange/v1/users/balances";
             let req = request.clone();
-            let this = self.clone();
 
-            async move { this.authenticated_post(endpoint, &req).await }
+            async move { self.authenticated_post(endpoint, &req).await }
         })
         .await
     }
@@ -444,9 +431,8 @@ impl CoinDCXClient {
         self.execute_with_retry(|| {
             let endpoint = "/exchange/v1/users/info";
             let req = request.clone();
-            let this = self.clone();
 
-            async move { this.authenticated_post(endpoint, &req).await }
+            async move { self.authenticated_post(endpoint, &req).await }
         })
         .await
     }
@@ -457,9 +443,8 @@ impl CoinDCXClient {
         self.execute_with_retry(|| {
             let endpoint = "/exchange/v1/orders/create";
             let ord = order.clone();
-            let this = self.clone();
 
-            async move { this.authenticated_post(endpoint, &ord).await }
+            async move { self.authenticated_post(endpoint, &ord).await }
         })
         .await
     }
@@ -470,10 +455,9 @@ impl CoinDCXClient {
         self.execute_with_retry(|| {
             let endpoint = "/exchange/v1/orders/cancel";
             let req = request.clone();
-            let this = self.clone();
 
             async move {
-                let _: serde_json::Value = this.authenticated_post(endpoint, &req).await?;
+                let _: serde_json::Value = self.authenticated_post(endpoint, &req).await?;
                 Ok(())
             }
         })
@@ -486,9 +470,8 @@ impl CoinDCXClient {
         self.execute_with_retry(|| {
             let endpoint = "/exchange/v1/orders/status";
             let req = request.clone();
-            let this = self.clone();
 
-            async move { this.authenticated_post(endpoint, &req).await }
+            async move { self.authenticated_post(endpoint, &req).await }
         })
         .await
     }
@@ -499,9 +482,8 @@ impl CoinDCXClient {
         self.execute_with_retry(|| {
             let endpoint = "/exchange/v1/orders/active_orders";
             let req = request.clone();
-            let this = self.clone();
 
-            async move { this.authenticated_post(endpoint, &req).await }
+            async move { self.authenticated_post(endpoint, &req).await }
         })
         .await
     }
@@ -516,10 +498,9 @@ impl CoinDCXClient {
         self.execute_with_retry(|| {
             let endpoint = "/exchange/v1/orders/cancel_all";
             let req = request.clone();
-            let this = self.clone();
 
             async move {
-                let _: serde_json::Value = this.authenticated_post(endpoint, &req).await?;
+                let _: serde_json::Value = self.authenticated_post(endpoint, &req).await?;
                 Ok(())
             }
         })
@@ -543,9 +524,8 @@ impl CoinDCXClient {
         self.execute_with_retry(|| {
             let endpoint = "/exchange/v1/orders/trade_history";
             let req = request.clone();
-            let this = self.clone();
 
-            async move { this.authenticated_post(endpoint, &req).await }
+            async move { self.authenticated_post(endpoint, &req).await }
         })
         .await
     }
@@ -617,6 +597,14 @@ mod tests {
         assert_eq!(client.max_retries, 5);
     }
 
+    #[test]
+    fn test_retry_backoff_is_jittered_and_capped() {
+        for attempt in 1..=4 {
+            assert!(retry_backoff(attempt) <= Duration::from_secs(1 << (attempt - 1)));
+        }
+        assert!(retry_backoff(u32::MAX) <= MAX_RETRY_BACKOFF);
+    }
+
     #[tokio::test]
     async fn test_circuit_breaker_state() {
         let client = CoinDCXClient::new("test_key", "test_secret");
@@ -66,15 +66,22 @@ pub enum OrderSide {
     Sell,
 }
 
-impl std::fmt::Display for OrderSide {
-    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+impl OrderSide {
+    /// Wire value as a static string (no formatting machinery involved)
+    pub const fn as_str(&self) -> &'static str {
         match self {
-            OrderSide::Buy => write!(f, "buy"),
-            OrderSide::Sell => write!(f, "sell"),
+            OrderSide::Buy => "buy",
+            OrderSide::Sell => "sell",
         }
     }
 }
 
+impl std::fmt::Display for OrderSide {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
 /// Order type
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
 #[serde(rename_all = "snake_case")]
@@ -85,17 +92,24 @@ pub enum OrderType {
     TakeProfit,
 }
 
-impl std::fmt::Display for OrderType {
-    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+impl OrderType {
+    /// Wire value as a static string (no formatting machinery involved)
+    pub const fn as_str(&self) -> &'static str {
         match self {
-            OrderType::MarketOrder => write!(f, "market_order"),
-            OrderType::LimitOrder => write!(f, "limit_order"),
-            OrderType::StopLimit => write!(f, "stop_limit"),
-            OrderType::TakeProfit => write!(f, "take_profit"),
+            OrderType::MarketOrder => "market_order",
+            OrderType::LimitOrder => "limit_order",
+            OrderType::StopLimit => "stop_limit",
+            OrderType::TakeProfit => "take_profit",
         }
     }
 }
 
+impl std::fmt::Display for OrderType {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
 /// Order status
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
 #[serde(rename_all = "snake_case")]
@@ -134,8 +148,8 @@ impl OrderRequest {
     /// Create a new market order request
     pub fn market(side: OrderSide, market: impl Into<String>, quantity: f64) -> Self {
         Self {
-            side: side.to_string(),
-            order_type: OrderType::MarketOrder.to_string(),
+            side: side.as_str().to_owned(),
+            order_type: OrderType::MarketOrder.as_str().to_owned(),
             market: market.into(),
             price_per_unit: None,
             total_quantity: quantity,
@@ -147,8 +161,8 @@ impl OrderRequest {
     /// Create a new limit order request
     pub fn limit(side: OrderSide, market: impl Into<String>, quantity: f64, price: f64) -> Self {
         Self {
-            side: side.to_string(),
-            order_type: OrderType::LimitOrder.to_string(),
+            side: side.as_str().to_owned(),
+            order_type: OrderType::LimitOrder.as_str().to_owned(),
             market: market.into(),
             price_per_unit: Some(price),
             total_quantity: quantity,
@@ -405,13 +419,24 @@ impl OrderBook {
     }
 
     /// Get best bid price
+    ///
+    /// Single pass over the book; nothing is collected or sorted.
     pub fn best_bid(&self) -> Option<f64> {
-        self.sorted_bids().first().map(|e| e.price)
+        Self::parsed_prices(&self.bids).reduce(f64::max)
     }
 
     /// Get best ask price
     pub fn best_ask(&self) -> Option<f64> {
-        self.sorted_asks().first().map(|e| e.price)
+        Self::parsed_prices(&self.asks).reduce(f64::min)
+    }
+
+    fn parsed_prices(
+        levels: &std::collections::HashMap<String, String>,
+    ) -> impl Iterator<Item = f64> + '_ {
+        levels.iter().filter_map(|(price, qty)| {
+            qty.parse::<f64>().ok()?;
+            price.parse::<f64>().ok()
+        })
     }
 
     /// Get bid-ask spread
@@ -462,7 +487,7 @@ impl ActiveOrdersRequest {
     }
 
     pub fn with_side(mut self, side: OrderSide) -> Self {
-        self.side = Some(side.to_string());
+        self.side = Some(side.as_str().to_owned());
         self
     }
 }
@@ -628,6 +653,27 @@ mod tests {
         assert_eq!(OrderType::LimitOrder.to_string(), "limit_order");
     }
 
+    #[test]
+    fn test_as_str_matches_serde() {
+        for side in [OrderSide::Buy, OrderSide::Sell] {
+            assert_eq!(
+                serde_json::to_value(side).unwrap(),
+                serde_json::Value::from(side.as_str())
+            );
+        }
+        for order_type in [
+            OrderType::MarketOrder,
+            OrderType::LimitOrder,
+            OrderType::StopLimit,
+            OrderType::TakeProfit,
+        ] {
+            assert_eq!(
+                serde_json::to_value(order_type).unwrap(),
+                serde_json::Value::from(order_type.as_str())
+            );
+        }
+    }
+
     #[test]
     fn test_order_request_market() {
         let order = OrderRequest::market(OrderSide::Buy, "BTCINR", 0.001);
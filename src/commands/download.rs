@@ -2,8 +2,34 @@
 //! Like Python's download_binance_data.py script
 
 use anyhow::Result;
-use crypto_strategies::data::{load_csv, BinanceDataFetcher, CoinDCXDataFetcher, DataSource};
-use tracing::info;
+use crypto_strategies::data::{BinanceDataFetcher, CoinDCXDataFetcher, DataSource, DownloadedPair};
+use std::sync::Arc;
+use tokio::sync::Semaphore;
+use tokio::task::JoinSet;
+use tracing::{error, info};
+
+/// Maximum number of (symbol, timeframe) downloads in flight at once
+const MAX_CONCURRENT_DOWNLOADS: usize = 4;
+
+/// Fetcher for the selected data source
+enum Fetcher {
+    Binance(BinanceDataFetcher),
+    CoinDCX(CoinDCXDataFetcher),
+}
+
+impl Fetcher {
+    async fn download_pair(
+        &self,
+        symbol: &str,
+        interval: &str,
+        days: u32,
+    ) -> Result<DownloadedPair> {
+        match self {
+            Fetcher::Binance(f) => f.download_pair(symbol, interval, days).await,
+            Fetcher::CoinDCX(f) => f.download_pair(symbol, interval, days).await,
+        }
+    }
+}
 
 pub fn run(
     pairs: String,
@@ -35,59 +61,78 @@ pub fn run(
     println!("  Output:     {}", output);
     println!("{}\n", "=".repeat(60));
 
+    let fetcher = Arc::new(match source {
+        DataSource::Binance => Fetcher::Binance(BinanceDataFetcher::new(&output)),
+        DataSource::CoinDCX => Fetcher::CoinDCX(CoinDCXDataFetcher::new(&output)),
+    });
+
+    // One task per (symbol, timeframe); downloads are network-bound, so overlap them.
+    // Every task shares the one fetcher, so the Binance client's request limit and
+    // progress display are shared too.
+    let tasks: Vec<(String, String)> = symbols
+        .iter()
+        .flat_map(|s| {
+            intervals
+                .iter()
+                .map(move |i| (s.to_string(), i.to_string()))
+        })
+        .collect();
+    let total_downloads = tasks.len();
+
+    println!(
+        "Downloading {} files ({} at a time)...",
+        total_downloads, MAX_CONCURRENT_DOWNLOADS
+    );
+
+    let mut results: Vec<Option<Result<DownloadedPair>>> =
+        (0..total_downloads).map(|_| None).collect();
+
+    rt.block_on(async {
+        let semaphore = Arc::new(Semaphore::new(MAX_CONCURRENT_DOWNLOADS));
+        let mut set = JoinSet::new();
+
+        for (idx, (symbol, interval)) in tasks.iter().cloned().enumerate() {
+            let fetcher = Arc::clone(&fetcher);
+            let semaphore = Arc::clone(&semaphore);
+            set.spawn(async move {
+                let _permit = semaphore.acquire_owned().await;
+                let result = fetcher.download_pair(&symbol, &interval, days).await;
+                (idx, result)
+            });
+        }
+
+        while let Some(joined) = set.join_next().await {
+            match joined {
+                Ok((idx, result)) => results[idx] = Some(result),
+                Err(e) => error!("Download task failed: {}", e),
+            }
+        }
+    });
+
     let mut total_candles = 0;
     let mut success_count = 0;
-    let mut total_downloads = 0;
-
-    match source {
-        DataSource::Binance => {
-            let fetcher = BinanceDataFetcher::new(&output);
-
-            for symbol in &symbols {
-                println!("\n{}:", symbol);
-
-                for interval in &intervals {
-                    total_downloads += 1;
-                    print!("  Downloading {} {}... ", symbol, interval);
-
-                    match rt.block_on(fetcher.download_pair(symbol, interval, days)) {
-                        Ok(filepath) => {
-                            if let Ok(candles) = load_csv(&filepath) {
-                                total_candles += candles.len();
-                                println!("✓ {} candles", candles.len());
-                                success_count += 1;
-                            }
-                        }
-                        Err(e) => {
-                            println!("✗ Error: {}", e);
-                        }
-                    }
-                }
-            }
+    let mut current_symbol: Option<&str> = None;
+
+    // Report in the original (symbol, timeframe) order regardless of completion order
+    for ((symbol, interval), result) in tasks.iter().zip(results) {
+        if current_symbol != Some(symbol.as_str()) {
+            println!("\n{}:", symbol);
+            current_symbol = Some(symbol.as_str());
         }
-        DataSource::CoinDCX => {
-            let fetcher = CoinDCXDataFetcher::new(&output);
-
-            for symbol in &symbols {
-                println!("\n{}:", symbol);
-
-                for interval in &intervals {
-                    total_downloads += 1;
-                    print!("  Downloading {} {}... ", symbol, interval);
-
-                    match rt.block_on(fetcher.download_pair(symbol, interval, days)) {
-                        Ok(filepath) => {
-                            if let Ok(candles) = load_csv(&filepath) {
-                                total_candles += candles.len();
-                                println!("✓ {} candles", candles.len());
-                                success_count += 1;
-                            }
-                        }
-                        Err(e) => {
-                            println!("✗ Error: {}", e);
-                        }
-                    }
-                }
+        print!("  {} {}... ", symbol, interval);
+
+        match result {
+            // Counts come back from the download, no need to re-read the CSV
+            Some(Ok((_, candles))) => {
+                total_candles += candles;
+                println!("✓ {} candles", candles);
+                success_count += 1;
+            }
+            Some(Err(e)) => {
+                println!("✗ Error: {}", e);
+            }
+            None => {
+                println!("✗ Error: download task aborted");
             }
         }
     }
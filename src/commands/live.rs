@@ -14,13 +14,13 @@
 use anyhow::{Context, Result};
 use chrono::Utc;
 use std::collections::HashMap;
-use std::sync::atomic::{AtomicBool, Ordering};
-use std::sync::Arc;
 use std::time::{Duration, Instant};
-use tokio::time::interval;
+use tokio::sync::watch;
+use tokio::task::JoinSet;
+use tokio::time::{interval_at, MissedTickBehavior};
 use tracing::{debug, error, info, warn};
 
-use crypto_strategies::coindcx::{ClientConfig, CoinDCXClient};
+use crypto_strategies::coindcx::{self, ClientConfig, CoinDCXClient};
 use crypto_strategies::multi_timeframe::{MultiTimeframeCandles, MultiTimeframeData};
 use crypto_strategies::oms::{ExecutionEngine, Fill, OrderBook, PositionManager, StrategyContext};
 use crypto_strategies::risk::RiskManager;
@@ -30,6 +30,26 @@ use crypto_strategies::state_manager::{
 use crypto_strategies::strategies::{self, Strategy};
 use crypto_strategies::{Config, Money, Side, Symbol, Trade};
 
+/// Bars of history fetched per timeframe at startup
+const BOOTSTRAP_BARS: u32 = 500;
+
+/// Bars fetched per timeframe each cycle on top of those missed since the cached tail
+///
+/// Covers the tail bar (refreshed in place) plus one bar of clock-skew slack.
+const UPDATE_BARS: u32 = 2;
+
+/// Raw candles keyed by (symbol, timeframe)
+type PrefetchedCandles = HashMap<(Symbol, String), Result<Vec<coindcx::Candle>>>;
+
+/// Order raw exchange candles oldest-first, as the strategies expect
+///
+/// The candles endpoint does not promise an order, so only sort when it is needed.
+fn sort_oldest_first(raw: &mut [coindcx::Candle]) {
+    if !raw.is_sorted_by_key(|c| c.time) {
+        raw.sort_unstable_by_key(|c| c.time);
+    }
+}
+
 /// Performance metrics for HFT monitoring
 #[derive(Debug, Default)]
 struct PerformanceMetrics {
@@ -118,9 +138,14 @@ struct LiveTrader {
 
     // MTF candle cache
     candle_cache: HashMap<Symbol, MultiTimeframeData>,
+    // Traded symbols, interned once from config (the list never changes at runtime)
+    symbols: Vec<Symbol>,
     required_timeframes: Vec<String>,
     primary_timeframe: String,
 
+    // Config fingerprint for checkpoints (config never changes after startup)
+    config_hash: String,
+
     // Trading state
     paper_mode: bool,
     cycle_count: u32,
@@ -217,8 +242,12 @@ impl LiveTrader {
             start.elapsed().as_micros()
         );
 
+        let config_hash = Self::compute_config_hash(&config);
+        let symbols = config.trading.symbols.iter().map(Symbol::new).collect();
+
         Ok(LiveTrader {
             config,
+            config_hash,
             strategy,
             risk_manager,
             exchange,
@@ -227,6 +256,7 @@ impl LiveTrader {
             position_manager: PositionManager::new(),
             execution_engine,
             candle_cache: HashMap::new(),
+            symbols,
             required_timeframes,
             primary_timeframe,
             paper_mode,
@@ -256,8 +286,8 @@ impl LiveTrader {
             self.risk_manager.consecutive_losses = checkpoint.consecutive_losses as usize;
             self.risk_manager.update_capital(checkpoint.portfolio_value);
 
-            let current_hash = self.config_hash();
-            if !checkpoint.config_hash.is_empty() && checkpoint.config_hash != current_hash {
+            let current_hash = &self.config_hash;
+            if !checkpoint.config_hash.is_empty() && checkpoint.config_hash != *current_hash {
                 warn!("⚠️  Config hash mismatch - parameters may have changed!");
                 warn!("  └─ Old hash: {}", checkpoint.config_hash);
                 warn!("  └─ New hash: {}", current_hash);
@@ -270,6 +300,9 @@ impl LiveTrader {
         let state_positions = self.state_manager.load_positions(Some("open"))?;
         info!("📦 Loading {} open position(s)...", state_positions.len());
 
+        // One fallback timestamp for the whole snapshot, not a clock read per row
+        let restored_at = Utc::now();
+
         for sp in state_positions {
             let symbol = Symbol::new(&sp.symbol);
             let side = if sp.side == "sell" {
@@ -284,7 +317,7 @@ impl LiveTrader {
                 sp.quantity,
                 sp.entry_time
                     .and_then(|t| t.parse().ok())
-                    .unwrap_or_else(Utc::now),
+                    .unwrap_or(restored_at),
                 0.0,
                 true,
             );
@@ -378,7 +411,43 @@ impl LiveTrader {
         Ok(())
     }
 
-    async fn bootstrap_candles(&mut self, symbol: &Symbol) -> Result<()> {
+    /// Fetch the last `bars(symbol, tf)` candles for every (symbol, timeframe) at once
+    ///
+    /// The requests are independent and network-bound, so they are all put in flight
+    /// together; the client's shared rate limiter still paces them.
+    async fn fetch_all_candles(&self, bars: impl Fn(&Symbol, &str) -> u32) -> PrefetchedCandles {
+        let mut set = JoinSet::new();
+        for symbol in &self.symbols {
+            for tf in &self.required_timeframes {
+                let exchange = self.exchange.clone();
+                let bars = bars(symbol, tf);
+                let key = (symbol.clone(), tf.clone());
+                set.spawn(async move {
+                    let result = exchange
+                        .get_candles(key.0.as_str(), &key.1, Some(bars))
+                        .await;
+                    (key, result)
+                });
+            }
+        }
+
+        let mut fetched = HashMap::with_capacity(set.len());
+        while let Some(joined) = set.join_next().await {
+            match joined {
+                Ok((key, result)) => {
+                    fetched.insert(key, result);
+                }
+                Err(e) => error!("Candle fetch task failed: {}", e),
+            }
+        }
+        fetched
+    }
+
+    fn bootstrap_candles(
+        &mut self,
+        symbol: &Symbol,
+        fetched: &mut PrefetchedCandles,
+    ) -> Result<()> {
         use crypto_strategies::Candle;
 
         let start = Instant::now();
@@ -388,21 +457,22 @@ impl LiveTrader {
 
         for tf in &self.required_timeframes {
             let tf_start = Instant::now();
-            let raw_candles = self
-                .exchange
-                .get_candles(symbol.as_str(), tf, Some(500))
-                .await?;
+            let mut raw_candles = fetched
+                .remove(&(symbol.clone(), tf.clone()))
+                .with_context(|| format!("{} {} bootstrap fetch aborted", symbol, tf))??;
 
             if raw_candles.is_empty() {
                 warn!("  ⚠️  No {} candles received for {}", tf, symbol);
                 continue;
             }
 
-            // Convert coindcx::Candle to crypto_strategies::Candle
-            let candles: Vec<Candle> = raw_candles
+            // Convert coindcx::Candle to crypto_strategies::Candle in one ordered pass
+            sort_oldest_first(&mut raw_candles);
+            let mut candles: Vec<Candle> = raw_candles
                 .into_iter()
                 .filter_map(|c| c.try_into().ok())
                 .collect();
+            candles.dedup_by_key(|c| c.datetime);
 
             if candles.is_empty() {
                 warn!("  ⚠️  Failed to convert {} candles for {}", tf, symbol);
@@ -436,7 +506,7 @@ impl LiveTrader {
         Ok(())
     }
 
-    async fn run(&mut self, shutdown: Arc<AtomicBool>) -> Result<()> {
+    async fn run(&mut self, mut shutdown: watch::Receiver<bool>) -> Result<()> {
         info!("════════════════════════════════════════════════════════");
         info!("🚀 LIVE TRADING ENGINE STARTED");
         info!("════════════════════════════════════════════════════════");
@@ -453,11 +523,11 @@ impl LiveTrader {
         info!("Capital:  {:.2}", self.paper_cash);
         info!("════════════════════════════════════════════════════════");
 
-        // Bootstrap all symbols
+        // Bootstrap all symbols from one concurrent prefetch
         let bootstrap_start = Instant::now();
-        for sym in &self.config.trading.symbols.clone() {
-            let symbol = Symbol::new(sym);
-            self.bootstrap_candles(&symbol).await?;
+        let mut fetched = self.fetch_all_candles(|_, _| BOOTSTRAP_BARS).await;
+        for symbol in self.symbols.clone() {
+            self.bootstrap_candles(&symbol, &mut fetched)?;
             self.orderbooks.insert(symbol.clone(), OrderBook::new());
         }
         info!(
@@ -468,18 +538,40 @@ impl LiveTrader {
         // Main event loop
         let poll_secs = self.parse_tf_seconds(&self.primary_timeframe);
         info!("⏱️  Polling interval: {} seconds", poll_secs);
-        let mut ticker = interval(Duration::from_secs(poll_secs));
 
-        while !shutdown.load(Ordering::Relaxed) {
-            ticker.tick().await;
+        // After the first cycle, tick on the wall-clock grid so cycles line up with
+        // candle closes; a slow cycle skips the ticks it overran instead of bursting
+        // to catch up
+        let until_boundary = poll_secs - Utc::now().timestamp().rem_euclid(poll_secs as i64) as u64;
+        let mut ticker = interval_at(
+            tokio::time::Instant::now() + Duration::from_secs(until_boundary),
+            Duration::from_secs(poll_secs),
+        );
+        ticker.set_missed_tick_behavior(MissedTickBehavior::Skip);
+        info!(
+            "⏱️  First cycle now, then aligned cycles from {} seconds",
+            until_boundary
+        );
+
+        // Run one cycle straight away so restored positions and pending orders
+        // are checked without waiting up to a full period for the first boundary
+        let mut first_cycle = true;
+        while !*shutdown.borrow() {
+            // Sleep until the next tick, but wake at once on a shutdown signal; a
+            // cycle that is already running always completes first
+            if first_cycle {
+                first_cycle = false;
+            } else {
+                tokio::select! {
+                    _ = ticker.tick() => {}
+                    _ = shutdown.changed() => break,
+                }
+            }
             let cycle_start = Instant::now();
 
             self.cycle_count += 1;
-            debug!(
-                "┌─ Cycle {} started at {}",
-                self.cycle_count,
-                Utc::now().format("%H:%M:%S%.3f")
-            );
+            // The subscriber already timestamps every line
+            debug!("┌─ Cycle {} started", self.cycle_count);
 
             if let Err(e) = self.process_cycle().await {
                 error!("│  ❌ Cycle error: {}", e);
@@ -530,11 +622,19 @@ impl LiveTrader {
     }
 
     async fn process_cycle(&mut self) -> Result<()> {
-        for sym in &self.config.trading.symbols.clone() {
-            let symbol = Symbol::new(sym);
+        // Fetch every symbol's latest bars together rather than one round-trip at a time
+        let fetch_start = Instant::now();
+        let mut fetched = self
+            .fetch_all_candles(|symbol, tf| self.update_bars(symbol, tf))
+            .await;
+        debug!(
+            "│  ✓ Fetched latest candles ({} μs)",
+            fetch_start.elapsed().as_micros()
+        );
 
+        for symbol in self.symbols.clone() {
             let update_start = Instant::now();
-            if let Err(e) = self.update_candles(&symbol).await {
+            if let Err(e) = self.update_candles(&symbol, &mut fetched) {
                 warn!("│  ⚠️  Candle update failed for {}: {}", symbol, e);
                 continue;
             }
@@ -558,38 +658,67 @@ impl LiveTrader {
         Ok(())
     }
 
-    async fn update_candles(&mut self, symbol: &Symbol) -> Result<()> {
+    /// Bars to refetch so the cache catches up with every bar since its tail
+    ///
+    /// Sized from the time elapsed since the last cached candle, so a late cycle or a
+    /// stalled loop still fills the gap; capped at the cache window, beyond which the
+    /// refetched bars replace the whole window.
+    fn update_bars(&self, symbol: &Symbol, tf: &str) -> u32 {
+        let Some(last) = self
+            .candle_cache
+            .get(symbol)
+            .and_then(|mtf_data| mtf_data.get(tf))
+            .and_then(|candles| candles.last())
+        else {
+            return BOOTSTRAP_BARS;
+        };
+
+        let tf_secs = self.parse_tf_seconds(tf) as i64;
+        let elapsed_secs = (Utc::now() - last.datetime).num_seconds().max(0);
+        let missed = u32::try_from(elapsed_secs / tf_secs).unwrap_or(u32::MAX);
+        missed.saturating_add(UPDATE_BARS).min(BOOTSTRAP_BARS)
+    }
+
+    fn update_candles(&mut self, symbol: &Symbol, fetched: &mut PrefetchedCandles) -> Result<()> {
         use crypto_strategies::Candle;
 
-        for tf in &self.required_timeframes.clone() {
-            if let Ok(raw_candles) = self
-                .exchange
-                .get_candles(symbol.as_str(), tf, Some(2))
-                .await
+        for tf in &self.required_timeframes {
+            let mut raw_candles = match fetched.remove(&(symbol.clone(), tf.clone())) {
+                Some(Ok(raw_candles)) => raw_candles,
+                Some(Err(e)) => {
+                    // Keep going with the other timeframes, but don't hide the failure
+                    warn!("│  ⚠️  {} {} candle fetch failed: {:#}", symbol, tf, e);
+                    continue;
+                }
+                None => continue,
+            };
+            sort_oldest_first(&mut raw_candles);
+            let Some(candles) = self
+                .candle_cache
+                .get_mut(symbol)
+                .and_then(|mtf_data| mtf_data.get_mut(tf))
+            else {
+                continue;
+            };
+
+            // Merge every returned bar past the cached tail so a delayed cycle
+            // doesn't drop bars; the tail bar itself is refreshed in place
+            for latest in raw_candles
+                .into_iter()
+                .filter_map(|c| Candle::try_from(c).ok())
             {
-                if let Some(latest_raw) = raw_candles.last() {
-                    if let Ok(latest) = Candle::try_from(latest_raw.clone()) {
-                        if let Some(mtf_data) = self.candle_cache.get_mut(symbol) {
-                            if let Some(candles) = mtf_data.get_mut(tf) {
-                                // Update last candle or append if new
-                                if let Some(last) = candles.last() {
-                                    if last.datetime == latest.datetime {
-                                        // Update existing candle
-                                        if let Some(last_mut) = candles.last_mut() {
-                                            *last_mut = latest;
-                                        }
-                                    } else {
-                                        // New candle
-                                        candles.push(latest);
-                                    }
-                                } else {
-                                    candles.push(latest);
-                                }
-                            }
-                        }
-                    }
+                match candles.last_mut() {
+                    Some(last) if last.datetime == latest.datetime => *last = latest,
+                    Some(last) if last.datetime > latest.datetime => {}
+                    _ => candles.push(latest),
                 }
             }
+
+            // Keep the bootstrap-sized window so memory and per-cycle indicator work stay flat
+            let window = BOOTSTRAP_BARS as usize;
+            if candles.len() > window {
+                candles.drain(..candles.len() - window);
+            }
         }
         Ok(())
     }
@@ -626,6 +755,7 @@ impl LiveTrader {
         let fill_check_start = Instant::now();
         let mut orders: Vec<_> = orderbook.get_all_orders().into_iter().cloned().collect();
         let initial_order_count = orders.len();
+        let fills_before = self.metrics.total_fills;
 
         for order in &mut orders {
             // Live trading passes None for bar_idx - no look-ahead bias concern in real-time
@@ -680,8 +810,7 @@ impl LiveTrader {
             }
         }
 
-        let fills_detected =
-            self.metrics.total_fills - (self.metrics.total_fills - orders.len() as u64);
+        let fills_detected = self.metrics.total_fills - fills_before;
         if fills_detected > 0 {
             debug!(
                 "│  ✓ Fill detection: {} orders checked, {} filled ({} μs)",
@@ -989,12 +1118,11 @@ impl LiveTrader {
             drawdown_pct: self.risk_manager.current_drawdown(),
             consecutive_losses: self.risk_manager.consecutive_losses as i32,
             paper_mode: self.paper_mode,
-            config_hash: self.config_hash(),
+            config_hash: self.config_hash.clone(),
             metadata: MetadataMap::new(),
         };
 
-        self.state_manager.save_checkpoint(&checkpoint)?;
-
+        let mut positions = Vec::new();
         for (symbol, pos) in self.position_manager.get_all_positions() {
             // Get cached stop/target levels if available
             let (stop_loss, take_profit) =
@@ -1028,11 +1156,11 @@ impl LiveTrader {
                 exit_time: None,
                 metadata,
             };
-            self.state_manager.save_position(&sp)?;
+            positions.push(sp);
         }
 
-        // Save pending orders from all orderbooks
-        self.state_manager.clear_pending_orders()?;
+        // Pending orders from all orderbooks
+        let mut pending_orders = Vec::new();
         for (symbol, orderbook) in &self.orderbooks {
             for order in orderbook.get_all_orders() {
                 if order.state == crypto_strategies::oms::OrderState::Open
@@ -1059,19 +1187,21 @@ impl LiveTrader {
                         stop_price: order.stop_price.map(|p| p.to_f64()),
                         client_id: order.client_id.clone(),
                     };
-                    self.state_manager.save_pending_order(&po)?;
+                    pending_orders.push(po);
                 }
             }
         }
 
-        Ok(())
+        // One transaction and one JSON backup export for the whole checkpoint
+        self.state_manager
+            .save_checkpoint_state(&checkpoint, &positions, &pending_orders)
     }
 
-    fn config_hash(&self) -> String {
+    fn compute_config_hash(config: &Config) -> String {
         use std::collections::hash_map::DefaultHasher;
         use std::hash::{Hash, Hasher};
         let mut hasher = DefaultHasher::new();
-        serde_json::to_string(&self.config)
+        serde_json::to_string(config)
             .unwrap_or_default()
             .hash(&mut hasher);
         format!("{:x}", hasher.finish())
@@ -1094,14 +1224,38 @@ pub async fn run(config: Config, state_db_path: String, paper_mode: bool) -> Res
     let mut trader = LiveTrader::new(config, &state_db_path, paper_mode).await?;
     trader.recover_state().await?;
 
-    let shutdown = Arc::new(AtomicBool::new(false));
-    let shutdown_clone = shutdown.clone();
+    let (shutdown_tx, shutdown_rx) = watch::channel(false);
 
     tokio::spawn(async move {
-        tokio::signal::ctrl_c().await.ok();
-        info!("🛑 Ctrl+C detected - initiating graceful shutdown...");
-        shutdown_clone.store(true, Ordering::Relaxed);
+        shutdown_signal().await;
+        let _ = shutdown_tx.send(true);
     });
 
-    trader.run(shutdown).await
+    trader.run(shutdown_rx).await
+}
+
+/// Resolve on Ctrl+C, or on SIGTERM where available (container stop, systemd, kill)
+async fn shutdown_signal() {
+    #[cfg(unix)]
+    {
+        use tokio::signal::unix::{signal, SignalKind};
+
+        match signal(SignalKind::terminate()) {
+            Ok(mut sigterm) => {
+                tokio::select! {
+                    _ = tokio::signal::ctrl_c() => {
+                        info!("🛑 Ctrl+C detected - initiating graceful shutdown...");
+                    }
+                    _ = sigterm.recv() => {
+                        info!("🛑 SIGTERM received - initiating graceful shutdown...");
+                    }
+                }
+                return;
+            }
+            Err(e) => warn!("Failed to install SIGTERM handler: {}", e),
+        }
+    }
+
+    tokio::signal::ctrl_c().await.ok();
+    info!("🛑 Ctrl+C detected - initiating graceful shutdown...");
 }
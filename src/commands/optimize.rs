@@ -7,6 +7,8 @@ use indicatif::{ProgressBar, ProgressStyle};
 use itertools::Itertools;
 use rayon::prelude::*;
 use std::collections::{HashMap, HashSet};
+use std::fmt::Write as _;
+use std::io::{self, Write};
 use std::sync::atomic::{AtomicUsize, Ordering};
 use std::sync::Arc;
 use std::time::Instant;
@@ -269,12 +271,13 @@ pub fn run(
         }
     }
 
-    // Generate all (task, param_config) combinations using generic grid generator
-    let mut all_runs: Vec<(OptTask, Config)> = Vec::new();
+    // Generate all (task, param_config) combinations using generic grid generator;
+    // runs borrow their task rather than each carrying a full copy of it
+    let mut all_runs: Vec<(&OptTask, Config)> = Vec::new();
     for task in &tasks {
         let configs = grid::generate_grid_configs(&task.config);
         for cfg in configs {
-            all_runs.push((task.clone(), cfg));
+            all_runs.push((task, cfg));
         }
     }
 
@@ -528,6 +531,20 @@ pub fn run(
     );
     println!("  ───┼─────────┼──────────┼─────────┼────────┼──────────┼───────┼──────────────┼─────┼─────────────────");
 
+    // Shortened labels are the same for every row, derive them once
+    let short_keys: Vec<(&str, String)> = grid_keys
+        .iter()
+        .map(|k| {
+            (
+                k.as_str(),
+                k.replace("_multiple", "").replace("_threshold", ""),
+            )
+        })
+        .collect();
+
+    // Write the whole table through one stdout lock and reuse the params buffer per row
+    let mut out = io::stdout().lock();
+    let mut grid_params = String::new();
     for (i, result) in all_results.iter().take(top).enumerate() {
         let group_idx = *result.params.get("_group_idx").unwrap_or(&0.0) as usize;
         let symbols_str = if group_idx < symbol_groups_flat.len() {
@@ -550,20 +567,19 @@ pub fn run(
         };
 
         // Format only grid params (the ones that vary)
-        let grid_params: String = grid_keys
-            .iter()
-            .filter_map(|k| {
-                result.params.get(k).map(|v| {
-                    let short_key = k.replace("_multiple", "").replace("_threshold", "");
-                    if v.fract() == 0.0 {
-                        format!("{}={}", short_key, *v as i64)
-                    } else {
-                        format!("{}={:.1}", short_key, v)
-                    }
-                })
-            })
-            .collect::<Vec<_>>()
-            .join(" ");
+        grid_params.clear();
+        for (key, short_key) in &short_keys {
+            if let Some(v) = result.params.get(*key) {
+                if !grid_params.is_empty() {
+                    grid_params.push(' ');
+                }
+                if v.fract() == 0.0 {
+                    let _ = write!(grid_params, "{}={}", short_key, *v as i64);
+                } else {
+                    let _ = write!(grid_params, "{}={:.1}", short_key, v);
+                }
+            }
+        }
 
         // Add rank indicator for top 3
         let rank_indicator = match i {
@@ -573,7 +589,8 @@ pub fn run(
             _ => "  ",
         };
 
-        println!(
+        writeln!(
+            out,
             "{} {:<2} │ {:>7.2} │ {:>7.1}% │ {:>6.1}% │ {:>5.0}% │ {:>8.2} │ {:>5} │ {:<12} │ {:>3} │ {}",
             rank_indicator,
             i + 1,
@@ -586,9 +603,10 @@ pub fn run(
             symbols_str,
             tf,
             grid_params
-        );
+        )?;
     }
-    println!();
+    writeln!(out)?;
+    drop(out);
 
     // Update config file with best parameters (unless --no-update)
     if !no_update && !all_results.is_empty() {
@@ -728,7 +746,7 @@ fn run_baseline_backtest(
     let symbols: Vec<Symbol> = config.trading.symbols();
     let timeframe = config.timeframe();
 
-    // Create strategy to get requirements
+    // Create strategy to get requirements (reused for the run below)
     let strategy = strategies::create_strategy(config).ok()?;
     let required_tfs = strategy.required_timeframes();
 
@@ -771,7 +789,6 @@ fn run_baseline_backtest(
         return None;
     }
 
-    let strategy = strategies::create_strategy(config).ok()?;
     let mut backtester = Backtester::new(config.clone(), strategy);
     let result = backtester.run(&mtf_data);
 
@@ -798,8 +815,7 @@ fn update_config_with_best(
 ) -> Result<()> {
     use std::fs;
 
-    let mut config_json: serde_json::Value =
-        serde_json::from_str(&fs::read_to_string(config_path)?)?;
+    let mut config_json: serde_json::Value = serde_json::from_slice(&fs::read(config_path)?)?;
 
     // Detect which grid params are booleans from the original config
     let boolean_params: std::collections::HashSet<String> = config_json
@@ -889,7 +905,7 @@ fn update_config_with_best(
         };
     }
 
-    fs::write(config_path, serde_json::to_string_pretty(&config_json)?)?;
+    fs::write(config_path, serde_json::to_vec_pretty(&config_json)?)?;
     Ok(())
 }
 
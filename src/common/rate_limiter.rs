@@ -6,7 +6,7 @@
 use std::sync::Arc;
 use std::time::Duration;
 use tokio::sync::{Mutex, Semaphore};
-use tokio::time::Instant;
+use tokio::time::{sleep, Instant};
 
 /// Configuration for the rate limiter
 #[derive(Debug, Clone)]
@@ -89,21 +89,22 @@ impl RateLimiter {
     /// Acquire a permit to make a request
     ///
     /// This method will:
-    /// 1. Refill permits if the refill interval has elapsed
-    /// 2. Wait for a permit to become available
+    /// 1. Refill the tokens earned since the last call
+    /// 2. Take a token if one is available (bursts up to the full rate)
+    /// 3. Otherwise sleep until the next token is due and try again
     ///
     /// The permit is consumed (not returned to the pool).
     pub async fn acquire(&self) {
-        // Try to refill permits
-        self.try_refill().await;
+        loop {
+            let wait = self.try_refill().await;
 
-        // Wait for a permit and consume it
-        let permit = self
-            .permits
-            .acquire()
-            .await
-            .expect("Semaphore should not be closed");
-        permit.forget(); // Consume the permit (don't return it to the pool)
+            if let Ok(permit) = self.permits.try_acquire() {
+                permit.forget(); // Consume the permit (don't return it to the pool)
+                return;
+            }
+
+            sleep(wait).await;
+        }
     }
 
     /// Try to acquire a permit without blocking
@@ -131,26 +132,35 @@ impl RateLimiter {
         self.max_permits
     }
 
-    /// Try to refill permits if the refill interval has elapsed
-    async fn try_refill(&self) {
+    /// Add the tokens earned since the last refill, one per `refill_interval / max_permits`
+    ///
+    /// Returns how long until the next token is due.
+    async fn try_refill(&self) -> Duration {
         let mut last_refill = self.last_refill.lock().await;
-        let elapsed = last_refill.elapsed();
+        let per_token = self.refill_interval / self.max_permits.max(1) as u32;
+        let current = self.permits.available_permits();
 
-        if elapsed >= self.refill_interval {
-            // Calculate how many intervals have passed
-            let intervals = (elapsed.as_millis() / self.refill_interval.as_millis()) as usize;
-            let permits_to_add = intervals * self.max_permits;
+        if current >= self.max_permits {
+            // A full bucket earns nothing; start accruing from now
+            *last_refill = Instant::now();
+            return per_token;
+        }
 
+        let earned = (last_refill.elapsed().as_nanos() / per_token.as_nanos().max(1)) as usize;
+        if earned > 0 {
             // Only add permits up to the maximum
-            let current = self.permits.available_permits();
-            let to_add = permits_to_add.min(self.max_permits.saturating_sub(current));
-
-            if to_add > 0 {
-                self.permits.add_permits(to_add);
+            let to_add = earned.min(self.max_permits - current);
+            self.permits.add_permits(to_add);
+
+            if current + to_add >= self.max_permits {
+                *last_refill = Instant::now();
+            } else {
+                // Keep the partial token already accrued toward the next one
+                *last_refill += per_token * earned as u32;
             }
-
-            *last_refill = Instant::now();
         }
+
+        per_token.saturating_sub(last_refill.elapsed())
     }
 }
 
@@ -247,6 +257,23 @@ mod tests {
         assert!(limiter.try_acquire().await);
     }
 
+    #[tokio::test]
+    async fn test_acquire_waits_for_next_token() {
+        let config = RateLimiterConfig::default()
+            .with_rate(2)
+            .with_refill_interval(Duration::from_millis(50));
+        let limiter = RateLimiter::new(config);
+
+        // Burst through the bucket, then the next acquire must wait for a refill
+        limiter.acquire().await;
+        limiter.acquire().await;
+        let start = Instant::now();
+        tokio::time::timeout(Duration::from_secs(1), limiter.acquire())
+            .await
+            .expect("acquire should resume once a token is earned");
+        assert!(start.elapsed() >= Duration::from_millis(20));
+    }
+
     #[tokio::test]
     async fn test_clone_shares_state() {
         let limiter1 = RateLimiter::with_rate(3);
@@ -3,14 +3,31 @@
 //! Handles loading and parsing of JSON configuration files with environment
 //! variable support for API credentials.
 
-use anyhow::{Context, Result};
+use anyhow::{ensure, Context, Result};
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::fs;
 use std::path::Path;
+use std::sync::OnceLock;
 
 use crate::Symbol;
 
+/// API key and secret from the environment, read once per process
+static ENV_CREDENTIALS: OnceLock<(Option<String>, Option<String>)> = OnceLock::new();
+
+/// Resolve API credentials on first use
+///
+/// Reads the process environment once; the binary loads `.env` into it at startup,
+/// before logging is configured.
+pub(crate) fn env_credentials() -> &'static (Option<String>, Option<String>) {
+    ENV_CREDENTIALS.get_or_init(|| {
+        (
+            std::env::var("COINDCX_API_KEY").ok(),
+            std::env::var("COINDCX_API_SECRET").ok(),
+        )
+    })
+}
+
 /// Main configuration structure
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct Config {
@@ -28,29 +45,99 @@ pub struct Config {
 impl Config {
     /// Load configuration from JSON file
     pub fn from_file(path: impl AsRef<Path>) -> Result<Self> {
-        let contents = fs::read_to_string(path.as_ref()).context("Failed to read config file")?;
+        let contents = fs::read(path.as_ref()).context("Failed to read config file")?;
         let mut config: Config =
-            serde_json::from_str(&contents).context("Failed to parse config JSON")?;
+            serde_json::from_slice(&contents).context("Failed to parse config JSON")?;
 
         // Load API credentials from environment if not set
-        if let Ok(api_key) = std::env::var("COINDCX_API_KEY") {
-            config.exchange.api_key = Some(api_key);
+        let (api_key, api_secret) = env_credentials();
+        if let Some(api_key) = api_key {
+            config.exchange.api_key = Some(api_key.clone());
         }
-        if let Ok(api_secret) = std::env::var("COINDCX_API_SECRET") {
-            config.exchange.api_secret = Some(api_secret);
+        if let Some(api_secret) = api_secret {
+            config.exchange.api_secret = Some(api_secret.clone());
         }
 
+        config.validate()?;
         Ok(config)
     }
 
-    /// Get strategy name from strategy config
+    /// Check numeric settings once at load time so the engine can trust them
+    pub fn validate(&self) -> Result<()> {
+        let unit = 0.0..=1.0;
+        let t = &self.trading;
+
+        ensure!(
+            t.initial_capital > 0.0,
+            "trading.initial_capital must be positive (got {})",
+            t.initial_capital
+        );
+        ensure!(
+            t.risk_per_trade > 0.0 && t.risk_per_trade <= 1.0,
+            "trading.risk_per_trade must be in (0, 1] (got {})",
+            t.risk_per_trade
+        );
+        ensure!(
+            t.max_positions > 0,
+            "trading.max_positions must be at least 1"
+        );
+        ensure!(
+            !t.symbols.is_empty(),
+            "trading.symbols must list at least one symbol"
+        );
+        for (name, value) in [
+            ("max_portfolio_heat", t.max_portfolio_heat),
+            ("max_position_pct", t.max_position_pct),
+            ("max_drawdown", t.max_drawdown),
+            ("drawdown_warning", t.drawdown_warning),
+            ("drawdown_critical", t.drawdown_critical),
+            ("drawdown_warning_multiplier", t.drawdown_warning_multiplier),
+            (
+                "drawdown_critical_multiplier",
+                t.drawdown_critical_multiplier,
+            ),
+            ("consecutive_loss_multiplier", t.consecutive_loss_multiplier),
+        ] {
+            ensure!(
+                unit.contains(&value),
+                "trading.{} must be in [0, 1] (got {})",
+                name,
+                value
+            );
+        }
+        ensure!(
+            t.drawdown_warning <= t.drawdown_critical,
+            "trading.drawdown_warning ({}) must not exceed trading.drawdown_critical ({})",
+            t.drawdown_warning,
+            t.drawdown_critical
+        );
+
+        for (name, value) in [
+            ("exchange.maker_fee", self.exchange.maker_fee),
+            ("exchange.taker_fee", self.exchange.taker_fee),
+            ("exchange.assumed_slippage", self.exchange.assumed_slippage),
+            ("backtest.commission", self.backtest.commission),
+            ("tax.tax_rate", self.tax.tax_rate),
+            ("tax.tds_rate", self.tax.tds_rate),
+        ] {
+            ensure!(
+                unit.contains(&value),
+                "{} must be in [0, 1] (got {})",
+                name,
+                value
+            );
+        }
+
+        Ok(())
+    }
+
+    /// Get strategy name from strategy config (borrowed, no allocation per lookup)
     /// Panics if name is not set in the strategy section
-    pub fn strategy_name(&self) -> String {
+    pub fn strategy_name(&self) -> &str {
         self.strategy
             .get("name")
             .and_then(|v| v.as_str())
             .expect("FATAL: 'name' is required in the 'strategy' section of config. Example: \"strategy\": { \"name\": \"volatility_regime\", ... }")
-            .to_string()
     }
 
     /// Get timeframe from strategy config
@@ -209,3 +296,137 @@ impl Default for BacktestConfig {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn valid_config() -> Config {
+        Config {
+            exchange: ExchangeConfig::default(),
+            trading: TradingConfig::default(),
+            strategy: serde_json::json!({ "name": "volatility_regime", "timeframe": "1d" }),
+            tax: TaxConfig::default(),
+            backtest: BacktestConfig::default(),
+            grid: None,
+        }
+    }
+
+    /// Apply `edit` to a valid config and return the validation error message
+    fn rejection(edit: impl FnOnce(&mut Config)) -> String {
+        let mut config = valid_config();
+        edit(&mut config);
+        config
+            .validate()
+            .expect_err("config should be rejected")
+            .to_string()
+    }
+
+    #[test]
+    fn test_default_config_is_valid() {
+        assert!(valid_config().validate().is_ok());
+    }
+
+    #[test]
+    fn test_shipped_configs_are_valid() {
+        let dir = Path::new(env!("CARGO_MANIFEST_DIR")).join("configs");
+        let mut checked = 0;
+        for entry in fs::read_dir(dir).unwrap() {
+            let path = entry.unwrap().path();
+            if path.extension().is_some_and(|ext| ext == "json") {
+                if let Err(e) = Config::from_file(&path) {
+                    panic!("{} failed validation: {:#}", path.display(), e);
+                }
+                checked += 1;
+            }
+        }
+        assert!(checked > 0, "no shipped configs found");
+    }
+
+    #[test]
+    fn test_rejects_non_positive_capital() {
+        assert!(rejection(|c| c.trading.initial_capital = 0.0).contains("initial_capital"));
+        assert!(rejection(|c| c.trading.initial_capital = -1_000.0).contains("initial_capital"));
+        assert!(rejection(|c| c.trading.initial_capital = f64::NAN).contains("initial_capital"));
+    }
+
+    #[test]
+    fn test_rejects_risk_per_trade_outside_unit_interval() {
+        assert!(rejection(|c| c.trading.risk_per_trade = 0.0).contains("risk_per_trade"));
+        assert!(rejection(|c| c.trading.risk_per_trade = -0.1).contains("risk_per_trade"));
+        assert!(rejection(|c| c.trading.risk_per_trade = 1.5).contains("risk_per_trade"));
+    }
+
+    #[test]
+    fn test_rejects_zero_max_positions() {
+        assert!(rejection(|c| c.trading.max_positions = 0).contains("max_positions"));
+    }
+
+    #[test]
+    fn test_rejects_empty_symbols() {
+        assert!(rejection(|c| c.trading.symbols.clear()).contains("symbols"));
+    }
+
+    #[test]
+    fn test_rejects_trading_fractions_outside_unit_interval() {
+        let edits: [(&str, fn(&mut TradingConfig)); 8] = [
+            ("max_portfolio_heat", |t| t.max_portfolio_heat = 1.5),
+            ("max_position_pct", |t| t.max_position_pct = -0.1),
+            ("max_drawdown", |t| t.max_drawdown = 2.0),
+            ("drawdown_warning", |t| t.drawdown_warning = -0.05),
+            ("drawdown_critical", |t| t.drawdown_critical = 1.2),
+            ("drawdown_warning_multiplier", |t| {
+                t.drawdown_warning_multiplier = 1.5
+            }),
+            ("drawdown_critical_multiplier", |t| {
+                t.drawdown_critical_multiplier = -0.5
+            }),
+            ("consecutive_loss_multiplier", |t| {
+                t.consecutive_loss_multiplier = 3.0
+            }),
+        ];
+
+        for (name, edit) in edits {
+            let message = rejection(|c| edit(&mut c.trading));
+            assert!(
+                message.contains(&format!("trading.{} must be in [0, 1]", name)),
+                "{}: {}",
+                name,
+                message
+            );
+        }
+    }
+
+    #[test]
+    fn test_rejects_warning_drawdown_above_critical() {
+        let message = rejection(|c| {
+            c.trading.drawdown_warning = 0.2;
+            c.trading.drawdown_critical = 0.1;
+        });
+        assert!(message.contains("must not exceed trading.drawdown_critical"));
+    }
+
+    #[test]
+    fn test_rejects_rates_outside_unit_interval() {
+        let edits: [(&str, fn(&mut Config)); 6] = [
+            ("exchange.maker_fee", |c| c.exchange.maker_fee = -0.001),
+            ("exchange.taker_fee", |c| c.exchange.taker_fee = 1.1),
+            ("exchange.assumed_slippage", |c| {
+                c.exchange.assumed_slippage = -0.01
+            }),
+            ("backtest.commission", |c| c.backtest.commission = 2.0),
+            ("tax.tax_rate", |c| c.tax.tax_rate = 1.3),
+            ("tax.tds_rate", |c| c.tax.tds_rate = -0.01),
+        ];
+
+        for (name, edit) in edits {
+            let message = rejection(edit);
+            assert!(
+                message.contains(&format!("{} must be in [0, 1]", name)),
+                "{}: {}",
+                name,
+                message
+            );
+        }
+    }
+}
@@ -7,8 +7,8 @@
 use anyhow::{Context, Result};
 use chrono::{DateTime, Duration, Utc};
 use std::collections::HashMap;
-use std::fs::File;
-use std::io::Write;
+use std::fs::{File, OpenOptions};
+use std::io::{BufRead, BufReader, BufWriter, Read, Seek, SeekFrom, Write};
 use std::path::{Path, PathBuf};
 use tracing::{info, warn};
 
@@ -27,6 +27,9 @@ pub type DataCoverageResult = (
     Vec<(Symbol, String, DateTime<Utc>)>,
 );
 
+/// Result of a pair download: (csv_path, candles_written)
+pub type DownloadedPair = (PathBuf, usize);
+
 // =============================================================================
 // Constants
 // =============================================================================
@@ -127,6 +130,31 @@ impl TryFrom<binance::BinanceKline> for Candle {
 // CSV Data Loading
 // =============================================================================
 
+/// Parse a CSV datetime as RFC 3339, or as `%Y-%m-%d %H:%M:%S` assumed UTC
+///
+/// Files written by the fetchers use the naive layout, so once a row parses
+/// that way `naive_first` is set and later rows try it first instead of
+/// failing an RFC 3339 parse on every line.
+fn parse_csv_datetime(s: &str, naive_first: &mut bool) -> Option<DateTime<Utc>> {
+    let parse_naive = |s: &str| {
+        chrono::NaiveDateTime::parse_from_str(s, "%Y-%m-%d %H:%M:%S")
+            .ok()
+            .map(|ndt| DateTime::<Utc>::from_naive_utc_and_offset(ndt, Utc))
+    };
+
+    if *naive_first {
+        return parse_naive(s).or_else(|| s.parse().ok());
+    }
+
+    if let Ok(dt) = s.parse::<DateTime<Utc>>() {
+        return Some(dt);
+    }
+
+    let dt = parse_naive(s);
+    *naive_first = dt.is_some();
+    dt
+}
+
 /// Load OHLCV data from CSV file with validation
 pub fn load_csv(path: impl AsRef<Path>) -> Result<Vec<Candle>> {
     let path = path.as_ref();
@@ -135,18 +163,18 @@ pub fn load_csv(path: impl AsRef<Path>) -> Result<Vec<Candle>> {
     let mut candles = Vec::new();
     let mut invalid_count = 0;
 
-    for (row_idx, result) in reader.records().enumerate() {
-        let record = result.context(format!("Failed to read row {}", row_idx + 1))?;
+    // Reuse one record buffer for every row instead of allocating per row
+    let mut record = csv::StringRecord::new();
+    let mut row_idx = 0;
+    let mut naive_first = false;
 
+    while reader
+        .read_record(&mut record)
+        .with_context(|| format!("Failed to read row {}", row_idx + 1))?
+    {
         let dt_str = record.get(0).context("Missing datetime column")?;
-        let datetime = dt_str
-            .parse::<DateTime<Utc>>()
-            .or_else(|_| {
-                // Try parsing without timezone and assume UTC
-                chrono::NaiveDateTime::parse_from_str(dt_str, "%Y-%m-%d %H:%M:%S")
-                    .map(|ndt| DateTime::<Utc>::from_naive_utc_and_offset(ndt, Utc))
-            })
-            .context(format!("Failed to parse datetime: {}", dt_str))?;
+        let datetime = parse_csv_datetime(dt_str, &mut naive_first)
+            .with_context(|| format!("Failed to parse datetime: {}", dt_str))?;
 
         let open: f64 = record
             .get(1)
@@ -186,6 +214,8 @@ pub fn load_csv(path: impl AsRef<Path>) -> Result<Vec<Candle>> {
                 );
             }
         }
+
+        row_idx += 1;
     }
 
     if invalid_count > 0 {
@@ -257,36 +287,48 @@ pub fn load_multi_symbol_with_range(
     start: Option<DateTime<Utc>>,
     end: Option<DateTime<Utc>>,
 ) -> Result<HashMap<Symbol, Vec<Candle>>> {
-    let mut data = HashMap::new();
+    use rayon::prelude::*;
 
-    for symbol in symbols {
-        let filename = format!("{}_{}.csv", symbol.as_str(), timeframe);
-        let path = data_dir.as_ref().join(&filename);
+    let data_path = data_dir.as_ref();
 
-        if !path.exists() {
-            warn!("Data file not found: {}", path.display());
-            continue;
-        }
+    // Parse each symbol's CSV in parallel
+    let results: Vec<Result<Option<(Symbol, Vec<Candle>)>>> = symbols
+        .par_iter()
+        .map(|symbol| {
+            let filename = format!("{}_{}.csv", symbol.as_str(), timeframe);
+            let path = data_path.join(&filename);
 
-        let candles = load_csv(&path).context(format!("Failed to load data for {}", symbol))?;
-        let original_len = candles.len();
+            if !path.exists() {
+                warn!("Data file not found: {}", path.display());
+                return Ok(None);
+            }
 
-        // Apply date filtering
-        let candles = filter_candles_by_date(candles, start, end);
+            let candles = load_csv(&path).context(format!("Failed to load data for {}", symbol))?;
+            let original_len = candles.len();
 
-        if start.is_some() || end.is_some() {
-            info!(
-                "Loaded {} candles for {} (filtered from {} total)",
-                candles.len(),
-                symbol,
-                original_len
-            );
-        } else {
-            info!("Loaded {} candles for {}", candles.len(), symbol);
-        }
+            // Apply date filtering
+            let candles = filter_candles_by_date(candles, start, end);
+
+            if start.is_some() || end.is_some() {
+                info!(
+                    "Loaded {} candles for {} (filtered from {} total)",
+                    candles.len(),
+                    symbol,
+                    original_len
+                );
+            } else {
+                info!("Loaded {} candles for {}", candles.len(), symbol);
+            }
 
-        if !candles.is_empty() {
-            data.insert(symbol.clone(), candles);
+            Ok((!candles.is_empty()).then(|| (symbol.clone(), candles)))
+        })
+        .collect();
+
+    // Surface the first failure in symbol order, as the sequential loader did
+    let mut data = HashMap::with_capacity(symbols.len());
+    for result in results {
+        if let Some((symbol, candles)) = result? {
+            data.insert(symbol, candles);
         }
     }
 
@@ -422,6 +464,72 @@ pub fn get_data_date_range(
     Ok(Some((min_date, max_date)))
 }
 
+/// First and last timestamps of a CSV, read from its first and last rows only
+fn csv_time_bounds(path: impl AsRef<Path>) -> Result<(DateTime<Utc>, DateTime<Utc>)> {
+    let path = path.as_ref();
+    let first_row = BufReader::new(File::open(path).context("Failed to open CSV file")?)
+        .lines()
+        .nth(1)
+        .context("CSV has no data row")??;
+    let (_, last_row) = read_last_row(&mut File::open(path).context("Failed to open CSV file")?)?;
+
+    let row_datetime = |row: &str| {
+        let field = row.split(',').next().unwrap_or_default().trim();
+        parse_csv_datetime(field, &mut false)
+            .with_context(|| format!("Failed to parse datetime: {}", field))
+    };
+    Ok((row_datetime(&first_row)?, row_datetime(&last_row)?))
+}
+
+/// Byte offset and text of the last data row of a CSV file
+///
+/// Only the end of the file is read, so large histories are not reloaded.
+fn read_last_row(file: &mut File) -> Result<(u64, String)> {
+    // A CSV row is far shorter than this, so the window always holds the
+    // newline that ends the second-to-last line
+    let len = file.metadata()?.len();
+    let window_start = len.saturating_sub(4096);
+    file.seek(SeekFrom::Start(window_start))?;
+    let mut tail = Vec::new();
+    file.read_to_end(&mut tail)?;
+
+    let body = tail.strip_suffix(b"\n").unwrap_or(&tail);
+    let row_start = body
+        .iter()
+        .rposition(|&b| b == b'\n')
+        .map(|i| i + 1)
+        .context("CSV has no data row")?;
+    let row = String::from_utf8_lossy(&body[row_start..])
+        .trim_end()
+        .to_string();
+    Ok((window_start + row_start as u64, row))
+}
+
+/// Sidecar file recording which source wrote a CSV (e.g. `BTCINR_1h.csv.source`)
+fn source_marker_path(csv_path: &Path) -> PathBuf {
+    let mut name = csv_path.as_os_str().to_owned();
+    name.push(".source");
+    PathBuf::from(name)
+}
+
+/// Record the source that wrote a CSV
+///
+/// Both sources save to the same `{SYMBOL}_{tf}.csv` names (Binance in USDT, CoinDCX
+/// in INR), so the marker keeps one source's candles from being appended to the other's.
+fn mark_csv_source(csv_path: &Path, source: DataSource) -> Result<()> {
+    std::fs::write(source_marker_path(csv_path), source.to_string())
+        .context("Failed to write CSV source marker")
+}
+
+/// Source that wrote a CSV, `None` for files saved before sources were recorded
+fn csv_source(csv_path: &Path) -> Option<DataSource> {
+    std::fs::read_to_string(source_marker_path(csv_path))
+        .ok()?
+        .trim()
+        .parse()
+        .ok()
+}
+
 /// Check which symbols need data for a given date range
 /// Returns: (missing_files, files_needing_earlier_data, files_needing_later_data)
 /// Note: files_needing_earlier_data only includes files where there's a significant gap (>7 days)
@@ -523,7 +631,7 @@ pub async fn ensure_data_available(
             .download_pair(symbol.as_str(), timeframe, days_back)
             .await
         {
-            Ok(path) => {
+            Ok((path, _)) => {
                 info!("  Downloaded to {}", path.display());
             }
             Err(e) => {
@@ -587,7 +695,7 @@ pub async fn ensure_data_for_range(
                 .download_pair(symbol.as_str(), timeframe, days_back)
                 .await
             {
-                Ok(path) => {
+                Ok((path, _)) => {
                     println!("    Downloaded to {}", path.display());
                 }
                 Err(e) => {
@@ -732,26 +840,6 @@ pub async fn ensure_data_for_range(
 
         for (symbol, timeframe, needed_end) in &needs_later_only {
             let filename = format!("{}_{}.csv", symbol.as_str(), timeframe);
-            let path = data_dir.join(&filename);
-
-            // Load existing data to get the start date
-            let existing_candles = match load_csv(&path) {
-                Ok(c) => c,
-                Err(e) => {
-                    warn!("Failed to load existing data for {}: {}", symbol, e);
-                    failed.push((symbol.clone(), timeframe.clone()));
-                    continue;
-                }
-            };
-
-            let existing_start = existing_candles
-                .iter()
-                .map(|c| c.datetime)
-                .min()
-                .unwrap_or(Utc::now());
-
-            // Fetch from existing start to now (this will get all newer data)
-            let days_back = (Utc::now() - existing_start).num_days() as u32 + 30;
 
             println!(
                 "    Refreshing {}_{}.csv with latest data...",
@@ -759,53 +847,48 @@ pub async fn ensure_data_for_range(
                 timeframe,
             );
 
-            match fetcher
-                .fetch_full_history(symbol.as_str(), timeframe, days_back)
-                .await
-            {
-                Ok(new_candles) => {
-                    if new_candles.is_empty() {
-                        println!("    No data available from Binance");
-                        continue;
-                    }
-
-                    // Merge and deduplicate
-                    let mut all_candles: Vec<Candle> = existing_candles
-                        .into_iter()
-                        .chain(new_candles.into_iter())
-                        .collect();
-
-                    all_candles.sort_by_key(|c| c.datetime);
-                    all_candles.dedup_by_key(|c| c.datetime);
-
-                    match fetcher.save_to_csv(&all_candles, &filename) {
-                        Ok(_) => {
-                            let new_end = all_candles.iter().map(|c| c.datetime).max().unwrap();
-                            println!(
-                                "    Extended: data now ends at {} ({} total candles)",
-                                new_end.format("%Y-%m-%d"),
-                                all_candles.len()
-                            );
-                            // Warn if data doesn't cover the requested end date
-                            if new_end < *needed_end {
-                                println!(
-                                    "    WARNING: Data ends at {} but {} was requested.",
-                                    new_end.format("%Y-%m-%d"),
-                                    needed_end.format("%Y-%m-%d")
-                                );
-                                println!(
-                                    "             Symbol may be delisted or rebranded on Binance."
-                                );
-                            }
-                        }
+            // Extend the file from its last row when this fetcher wrote it; otherwise
+            // replace it with a full download over the span it already covers
+            let result = match fetcher.appendable_bounds(&filename) {
+                Some((_, last_dt)) => {
+                    fetcher
+                        .extend_csv(symbol.as_str(), timeframe, &filename, last_dt)
+                        .await
+                }
+                None => {
+                    let existing_start = match csv_time_bounds(data_dir.join(&filename)) {
+                        Ok((first, _)) => first,
                         Err(e) => {
-                            println!("    FAILED to save data: {}", e);
+                            warn!("Failed to read existing data for {}: {}", symbol, e);
                             failed.push((symbol.clone(), timeframe.clone()));
+                            continue;
                         }
+                    };
+                    let days_back = (Utc::now() - existing_start).num_days() as u32 + 1;
+                    fetcher
+                        .download_pair(symbol.as_str(), timeframe, days_back)
+                        .await
+                }
+            };
+
+            match result.and_then(|(path, _)| csv_time_bounds(path)) {
+                Ok((_, new_end)) => {
+                    println!(
+                        "    Extended: data now ends at {}",
+                        new_end.format("%Y-%m-%d")
+                    );
+                    // Warn if data doesn't cover the requested end date
+                    if new_end < *needed_end {
+                        println!(
+                            "    WARNING: Data ends at {} but {} was requested.",
+                            new_end.format("%Y-%m-%d"),
+                            needed_end.format("%Y-%m-%d")
+                        );
+                        println!("             Symbol may be delisted or rebranded on Binance.");
                     }
                 }
                 Err(e) => {
-                    println!("    FAILED to fetch data: {}", e);
+                    println!("    FAILED to refresh data: {}", e);
                     failed.push((symbol.clone(), timeframe.clone()));
                 }
             }
@@ -873,9 +956,9 @@ pub fn check_and_fetch_data(
     end: Option<DateTime<Utc>>,
 ) -> Result<()> {
     // Validate symbol names have INR suffix
+    // Returned as an error (not process::exit) so main unwinds and log buffers flush
     if let Some(err) = validate_symbol_names(symbols) {
-        eprintln!("\n❌ {}", err);
-        std::process::exit(1);
+        anyhow::bail!(err);
     }
 
     let data_dir = data_dir.as_ref();
@@ -1063,12 +1146,11 @@ impl CoinDCXDataFetcher {
             return Ok(Vec::new());
         }
 
-        let oldest_dt = candles
-            .iter()
-            .map(|c| c.datetime)
-            .min()
-            .unwrap_or(start_time);
-        let newest_dt = candles.iter().map(|c| c.datetime).max().unwrap_or(end_time);
+        // Single pass for both ends of the range
+        let (oldest_dt, newest_dt) = candles.iter().fold(
+            (candles[0].datetime, candles[0].datetime),
+            |(oldest, newest), c| (oldest.min(c.datetime), newest.max(c.datetime)),
+        );
 
         info!(
             "  Fetched {} candles, range: {} to {}",
@@ -1093,7 +1175,8 @@ impl CoinDCXDataFetcher {
     /// Save candles to CSV file
     pub fn save_to_csv(&self, candles: &[Candle], filename: &str) -> Result<PathBuf> {
         let filepath = self.data_dir.join(filename);
-        let mut file = File::create(&filepath).context("Failed to create output file")?;
+        let mut file =
+            BufWriter::new(File::create(&filepath).context("Failed to create output file")?);
 
         writeln!(file, "datetime,open,high,low,close,volume")?;
 
@@ -1109,18 +1192,22 @@ impl CoinDCXDataFetcher {
                 candle.volume
             )?;
         }
+        file.flush()?;
+        mark_csv_source(&filepath, DataSource::CoinDCX)?;
 
         info!("Saved {} rows to {}", candles.len(), filepath.display());
         Ok(filepath)
     }
 
     /// Download historical data for a symbol and save to CSV
+    ///
+    /// Returns the file path and the number of candles written.
     pub async fn download_pair(
         &self,
         symbol: &str,
         interval: &str,
         days_back: u32,
-    ) -> Result<PathBuf> {
+    ) -> Result<DownloadedPair> {
         let pair = Self::to_pair(symbol);
         let candles = self.fetch_full_history(&pair, interval, days_back).await?;
 
@@ -1135,7 +1222,8 @@ impl CoinDCXDataFetcher {
         };
 
         let filename = format!("{}_{}.csv", symbol_name, interval);
-        self.save_to_csv(&candles, &filename)
+        let path = self.save_to_csv(&candles, &filename)?;
+        Ok((path, candles.len()))
     }
 }
 
@@ -1184,29 +1272,7 @@ impl BinanceDataFetcher {
             .get_klines(&binance_pair, interval, None, None, limit)
             .await?;
 
-        let mut candles = Vec::with_capacity(klines.len());
-        let mut invalid_count = 0;
-
-        for kline in klines {
-            match Candle::try_from(kline) {
-                Ok(candle) => candles.push(candle),
-                Err(e) => {
-                    invalid_count += 1;
-                    warn!("Skipping invalid candle for {}: {}", symbol, e);
-                }
-            }
-        }
-
-        if invalid_count > 0 {
-            warn!(
-                "Skipped {} invalid candles out of {} for {}",
-                invalid_count,
-                invalid_count + candles.len(),
-                symbol
-            );
-        }
-
-        Ok(candles)
+        Ok(Self::to_candles(symbol, klines))
     }
 
     /// Fetch full historical data
@@ -1221,6 +1287,31 @@ impl BinanceDataFetcher {
             .fetch_full_history(symbol, interval, days_back)
             .await?;
 
+        Ok(Self::to_candles(symbol, klines))
+    }
+
+    /// Fetch candles with open time after `since` up to now
+    pub async fn fetch_since(
+        &self,
+        symbol: &str,
+        interval: &str,
+        since: DateTime<Utc>,
+    ) -> Result<Vec<Candle>> {
+        let klines = self
+            .client
+            .fetch_range(
+                symbol,
+                interval,
+                since.timestamp_millis() + 1,
+                Utc::now().timestamp_millis(),
+            )
+            .await?;
+
+        Ok(Self::to_candles(symbol, klines))
+    }
+
+    /// Convert klines to candles, skipping (and reporting) invalid rows
+    fn to_candles(symbol: &str, klines: Vec<binance::BinanceKline>) -> Vec<Candle> {
         let mut candles = Vec::with_capacity(klines.len());
         let mut invalid_count = 0;
 
@@ -1243,19 +1334,131 @@ impl BinanceDataFetcher {
             );
         }
 
-        Ok(candles)
+        candles
     }
 
     /// Save candles to CSV file
     pub fn save_to_csv(&self, candles: &[Candle], filename: &str) -> Result<PathBuf> {
         let filepath = self.data_dir.join(filename);
-        let mut file = File::create(&filepath).context("Failed to create output file")?;
+        let mut file =
+            BufWriter::new(File::create(&filepath).context("Failed to create output file")?);
 
         writeln!(file, "datetime,open,high,low,close,volume")?;
+        Self::write_rows(&mut file, candles)?;
+        file.flush()?;
+        mark_csv_source(&filepath, DataSource::Binance)?;
+
+        info!("Saved {} rows to {}", candles.len(), filepath.display());
+        Ok(filepath)
+    }
+
+    /// CSV bounds, if this fetcher wrote the file and can extend it in place
+    ///
+    /// `None` when the file is missing, unreadable, or was not saved by this fetcher.
+    fn appendable_bounds(&self, filename: &str) -> Option<(DateTime<Utc>, DateTime<Utc>)> {
+        let filepath = self.data_dir.join(filename);
+        if csv_source(&filepath) != Some(DataSource::Binance) {
+            return None;
+        }
+        csv_time_bounds(&filepath).ok()
+    }
+
+    /// Bring a CSV whose last row opens at `last_dt` up to date
+    ///
+    /// Only candles from `last_dt` onward are fetched: that row is rewritten (it was
+    /// usually still forming when saved) and newer candles are appended.
+    async fn extend_csv(
+        &self,
+        symbol: &str,
+        interval: &str,
+        filename: &str,
+        last_dt: DateTime<Utc>,
+    ) -> Result<DownloadedPair> {
+        // fetch_since is exclusive; step back 1ms to include the last row
+        let fetched = self
+            .fetch_since(symbol, interval, last_dt - Duration::milliseconds(1))
+            .await?;
+        self.refresh_csv_tail(filename, last_dt, fetched)
+    }
+
+    /// Merge freshly fetched candles into a CSV whose last row opens at `last_dt`
+    ///
+    /// The candle at `last_dt` replaces that row and later candles are appended;
+    /// anything older is ignored. Returns the number of rows written.
+    fn refresh_csv_tail(
+        &self,
+        filename: &str,
+        last_dt: DateTime<Utc>,
+        fetched: Vec<Candle>,
+    ) -> Result<DownloadedPair> {
+        let fresh: Vec<Candle> = fetched
+            .into_iter()
+            .filter(|c| c.datetime >= last_dt)
+            .collect();
+
+        // The refetch starts at the last row, which the exchange always has, so an
+        // empty result means the fetch failed rather than that nothing is new
+        if fresh.is_empty() {
+            anyhow::bail!("No candles returned from {} for {}", last_dt, filename);
+        }
+
+        let path = if fresh[0].datetime == last_dt {
+            self.replace_last_row(&fresh, filename)?
+        } else {
+            // The exchange did not return the tail candle; keep the row and only append
+            self.append_to_csv(&fresh, filename)?
+        };
+        Ok((path, fresh.len()))
+    }
 
+    /// Replace the last row of an existing CSV file with `candles`
+    ///
+    /// Only the end of the file is read and rewritten, so large histories are not
+    /// reloaded.
+    pub fn replace_last_row(&self, candles: &[Candle], filename: &str) -> Result<PathBuf> {
+        let filepath = self.data_dir.join(filename);
+        let mut file = OpenOptions::new()
+            .read(true)
+            .write(true)
+            .open(&filepath)
+            .context("Failed to open output file for update")?;
+
+        let (row_start, _) = read_last_row(&mut file)?;
+        file.set_len(row_start)?;
+        file.seek(SeekFrom::End(0))?;
+        let mut out = BufWriter::new(file);
+        Self::write_rows(&mut out, candles)?;
+        out.flush()?;
+
+        info!(
+            "Refreshed last row and appended {} rows to {}",
+            candles.len() - 1,
+            filepath.display()
+        );
+        Ok(filepath)
+    }
+
+    /// Append candles to an existing CSV file (no header is written)
+    pub fn append_to_csv(&self, candles: &[Candle], filename: &str) -> Result<PathBuf> {
+        let filepath = self.data_dir.join(filename);
+        let mut file = BufWriter::new(
+            OpenOptions::new()
+                .append(true)
+                .open(&filepath)
+                .context("Failed to open output file for append")?,
+        );
+
+        Self::write_rows(&mut file, candles)?;
+        file.flush()?;
+
+        info!("Appended {} rows to {}", candles.len(), filepath.display());
+        Ok(filepath)
+    }
+
+    fn write_rows(out: &mut impl Write, candles: &[Candle]) -> Result<()> {
         for candle in candles {
             writeln!(
-                file,
+                out,
                 "{},{},{},{},{},{}",
                 candle.datetime.format("%Y-%m-%d %H:%M:%S"),
                 candle.open,
@@ -1265,25 +1468,22 @@ impl BinanceDataFetcher {
                 candle.volume
             )?;
         }
-
-        info!("Saved {} rows to {}", candles.len(), filepath.display());
-        Ok(filepath)
+        Ok(())
     }
 
     /// Download historical data for a symbol and save to CSV
+    ///
+    /// If a CSV saved by this fetcher already covers the start of the requested
+    /// window, it is extended in place from its last row (see `extend_csv`);
+    /// otherwise the full window is downloaded and the file replaced. Returns the
+    /// file path and the number of candles written.
     /// Uses INR suffix in filename to maintain compatibility with existing data files
     pub async fn download_pair(
         &self,
         symbol: &str,
         interval: &str,
         days_back: u32,
-    ) -> Result<PathBuf> {
-        let candles = self.fetch_full_history(symbol, interval, days_back).await?;
-
-        if candles.is_empty() {
-            anyhow::bail!("No data fetched for {}", symbol);
-        }
-
+    ) -> Result<DownloadedPair> {
         // Extract base symbol and add INR suffix for filename compatibility
         let base = symbol
             .trim()
@@ -1293,7 +1493,22 @@ impl BinanceDataFetcher {
         let symbol_name = format!("{}INR", base);
 
         let filename = format!("{}_{}.csv", symbol_name, interval);
-        self.save_to_csv(&candles, &filename)
+        let requested_start = Utc::now() - Duration::days(days_back as i64);
+
+        if let Some((first, last_dt)) = self.appendable_bounds(&filename) {
+            if first <= requested_start {
+                return self.extend_csv(symbol, interval, &filename, last_dt).await;
+            }
+        }
+
+        let candles = self.fetch_full_history(symbol, interval, days_back).await?;
+
+        if candles.is_empty() {
+            anyhow::bail!("No data fetched for {}", symbol);
+        }
+
+        let path = self.save_to_csv(&candles, &filename)?;
+        Ok((path, candles.len()))
     }
 
     /// Download multiple timeframes for a symbol
@@ -1302,7 +1517,7 @@ impl BinanceDataFetcher {
         symbol: &str,
         timeframes: &[&str],
         days_back: u32,
-    ) -> Vec<Result<PathBuf>> {
+    ) -> Vec<Result<DownloadedPair>> {
         let mut results = Vec::new();
 
         for tf in timeframes {
@@ -1467,6 +1682,7 @@ impl ValidationResult {
 #[cfg(test)]
 mod tests {
     use super::*;
+    use chrono::TimeZone;
 
     #[test]
     fn test_candle_cache() {
@@ -1509,4 +1725,78 @@ mod tests {
         assert_eq!(CoinDCXDataFetcher::to_pair("BTC"), "I-BTC_INR");
         assert_eq!(CoinDCXDataFetcher::to_pair("ETHINR"), "I-ETH_INR");
     }
+
+    #[test]
+    fn test_refresh_csv_tail_rewrites_last_row() {
+        let dir = std::env::temp_dir().join(format!("csv_tail_{}", std::process::id()));
+        let fetcher = BinanceDataFetcher::new(&dir);
+        let filename = "BTCINR_1h.csv";
+        let bar = |hour: u32, close: f64| Candle {
+            datetime: Utc.with_ymd_and_hms(2024, 1, 1, hour, 0, 0).unwrap(),
+            open: 100.0,
+            high: 110.0,
+            low: 90.0,
+            close,
+            volume: 10.0,
+        };
+
+        // First download ended on a still-forming 02:00 bar
+        fetcher
+            .save_to_csv(&[bar(0, 100.0), bar(1, 101.0), bar(2, 102.0)], filename)
+            .unwrap();
+        let last_dt = bar(2, 0.0).datetime;
+        assert_eq!(
+            fetcher.appendable_bounds(filename),
+            Some((bar(0, 0.0).datetime, last_dt))
+        );
+
+        // Re-run: the refetch includes an older bar, the final 02:00 bar and a new one
+        let fetched = vec![bar(1, 101.0), bar(2, 105.0), bar(3, 106.0)];
+        let (path, count) = fetcher
+            .refresh_csv_tail(filename, last_dt, fetched)
+            .unwrap();
+
+        // An empty refetch is a failure, not "already up to date"
+        assert!(fetcher
+            .refresh_csv_tail(filename, last_dt, Vec::new())
+            .is_err());
+
+        // A file saved by another source (or before sources were recorded) is never appended to
+        std::fs::remove_file(source_marker_path(&path)).unwrap();
+        assert_eq!(fetcher.appendable_bounds(filename), None);
+
+        let candles = load_csv(&path).unwrap();
+        std::fs::remove_dir_all(&dir).ok();
+
+        assert_eq!(count, 2);
+        assert_eq!(candles.len(), 4);
+        assert_eq!(candles[2].datetime, last_dt);
+        assert_eq!(candles[2].close, 105.0);
+        assert_eq!(candles[3].close, 106.0);
+    }
+
+    #[test]
+    fn test_parse_csv_datetime() {
+        let expected = Utc.with_ymd_and_hms(2024, 1, 2, 3, 4, 5).unwrap();
+
+        let mut naive_first = false;
+        assert_eq!(
+            parse_csv_datetime("2024-01-02T03:04:05Z", &mut naive_first),
+            Some(expected)
+        );
+        assert!(!naive_first);
+
+        assert_eq!(
+            parse_csv_datetime("2024-01-02 03:04:05", &mut naive_first),
+            Some(expected)
+        );
+        assert!(naive_first);
+
+        // Mixed files still parse once the naive layout is preferred
+        assert_eq!(
+            parse_csv_datetime("2024-01-02T03:04:05+00:00", &mut naive_first),
+            Some(expected)
+        );
+        assert_eq!(parse_csv_datetime("not a date", &mut naive_first), None);
+    }
 }
@@ -9,6 +9,7 @@ use std::collections::HashMap;
 ///
 /// Takes a base config with a grid section and generates all possible
 /// combinations by computing the cartesian product of all grid params.
+/// The generated configs carry no grid section of their own.
 pub fn generate_grid_configs(config: &Config) -> Vec<Config> {
     let grid = match &config.grid {
         Some(g) if !g.is_empty() => g,
@@ -25,11 +26,15 @@ pub fn generate_grid_configs(config: &Config) -> Vec<Config> {
     // Generate cartesian product indices
     let combos = cartesian_product_indices(&values);
 
+    // Each combination is a concrete run, so don't copy the whole grid into every one
+    let mut base = config.clone();
+    base.grid = None;
+
     // Build configs for each combination
     combos
         .into_iter()
         .map(|indices| {
-            let mut cfg = config.clone();
+            let mut cfg = base.clone();
             if let Some(obj) = cfg.strategy.as_object_mut() {
                 for (i, &idx) in indices.iter().enumerate() {
                     let key = keys[i];
@@ -99,6 +99,9 @@ pub fn ema(values: &[f64], period: usize) -> Vec<Option<f64>> {
 }
 
 /// Calculate Weighted Moving Average (manual implementation - not in ta crate)
+///
+/// Single pass: keeps the window's plain and weighted sums, sliding both by one
+/// value per bar instead of re-summing the whole window.
 pub fn wma(values: &[f64], period: usize) -> Vec<Option<f64>> {
     if values.is_empty() || period == 0 {
         return vec![];
@@ -106,17 +109,27 @@ pub fn wma(values: &[f64], period: usize) -> Vec<Option<f64>> {
 
     let mut result = Vec::with_capacity(values.len());
     let weight_sum: f64 = (1..=period).map(|x| x as f64).sum();
+    let p = period as f64;
+
+    // sum = Σ window values, weighted = Σ (j + 1) * window[j]
+    let mut sum = 0.0;
+    let mut weighted = 0.0;
+
+    for (i, &value) in values.iter().enumerate() {
+        if i < period {
+            sum += value;
+            weighted += value * (i + 1) as f64;
+        } else {
+            // Sliding drops every weight by one (removing the old window's sum),
+            // then the new value enters with the top weight
+            weighted += p * value - sum;
+            sum += value - values[i - period];
+        }
 
-    for i in 0..values.len() {
         if i + 1 < period {
             result.push(None);
         } else {
-            let weighted_sum: f64 = values[i + 1 - period..=i]
-                .iter()
-                .enumerate()
-                .map(|(j, &v)| v * (j + 1) as f64)
-                .sum();
-            result.push(Some(weighted_sum / weight_sum));
+            result.push(Some(weighted / weight_sum));
         }
     }
 
@@ -214,21 +227,20 @@ pub fn atr(high: &[f64], low: &[f64], close: &[f64], period: usize) -> Vec<Optio
 
 /// Calculate ATR as percentage of price
 pub fn atr_percent(high: &[f64], low: &[f64], close: &[f64], period: usize) -> Vec<Option<f64>> {
-    let atr_vals = atr(high, low, close, period);
+    let mut atr_vals = atr(high, low, close, period);
+
+    // Rescale in place rather than collecting into a second buffer
+    for (atr_opt, &price) in atr_vals.iter_mut().zip(close.iter()) {
+        if let Some(atr_val) = atr_opt {
+            *atr_val = if price > 0.0 {
+                (*atr_val / price) * 100.0
+            } else {
+                0.0
+            };
+        }
+    }
 
     atr_vals
-        .iter()
-        .zip(close.iter())
-        .map(|(atr_opt, &price)| {
-            atr_opt.map(|atr_val| {
-                if price > 0.0 {
-                    (atr_val / price) * 100.0
-                } else {
-                    0.0
-                }
-            })
-        })
-        .collect()
 }
 
 /// Bollinger Bands result from ta crate
@@ -370,7 +382,7 @@ pub fn stochastic(
     };
 
     let mut k_values = Vec::with_capacity(high.len());
-    let mut raw_k = Vec::new();
+    let mut raw_k = Vec::with_capacity((high.len() + 1).saturating_sub(k_period));
 
     for i in 0..high.len() {
         let item = make_data_item(close[i], high[i], low[i], close[i], 0.0);
@@ -386,7 +398,8 @@ pub fn stochastic(
     // Calculate %D as SMA of %K
     let d_sma = sma(&raw_k, d_period);
     let padding = high.len() - d_sma.len();
-    let mut d_values: Vec<Option<f64>> = vec![None; padding];
+    let mut d_values: Vec<Option<f64>> = Vec::with_capacity(high.len());
+    d_values.resize(padding, None);
     d_values.extend(d_sma);
 
     (k_values, d_values)
@@ -410,7 +423,7 @@ pub fn fast_stochastic(
     };
 
     let mut k_values = Vec::with_capacity(high.len());
-    let mut raw_k = Vec::new();
+    let mut raw_k = Vec::with_capacity((high.len() + 1).saturating_sub(k_period));
 
     for i in 0..high.len() {
         let item = make_data_item(close[i], high[i], low[i], close[i], 0.0);
@@ -426,7 +439,8 @@ pub fn fast_stochastic(
     // Calculate %D as SMA of %K
     let d_sma = sma(&raw_k, d_period);
     let padding = high.len() - d_sma.len();
-    let mut d_values: Vec<Option<f64>> = vec![None; padding];
+    let mut d_values: Vec<Option<f64>> = Vec::with_capacity(high.len());
+    d_values.resize(padding, None);
     d_values.extend(d_sma);
 
     (k_values, d_values)
@@ -642,7 +656,7 @@ pub fn adx(high: &[f64], low: &[f64], close: &[f64], period: usize) -> Vec<Optio
     let mut result = vec![None; high.len()];
 
     // Calculate DX only where DI is valid
-    let mut dx_values: Vec<f64> = Vec::new();
+    let mut dx_values: Vec<f64> = Vec::with_capacity(high.len().saturating_sub(di_start));
     for i in di_start..high.len() {
         if let (Some(pdi), Some(mdi)) = (
             plus_di.get(i).and_then(|x| *x),
@@ -997,6 +1011,29 @@ mod tests {
         assert!((result[4].unwrap() - 4.0).abs() < 0.001);
     }
 
+    #[test]
+    fn test_wma() {
+        let values: Vec<f64> = (0..50)
+            .map(|i| 100.0 + (i as f64 * 0.7).sin() * 5.0)
+            .collect();
+        let period = 7;
+        let weight_sum: f64 = (1..=period).map(|x| x as f64).sum();
+
+        let result = wma(&values, period);
+        assert_eq!(result.len(), values.len());
+        assert!(result[period - 2].is_none());
+
+        for i in period - 1..values.len() {
+            let expected: f64 = values[i + 1 - period..=i]
+                .iter()
+                .enumerate()
+                .map(|(j, &v)| v * (j + 1) as f64)
+                .sum::<f64>()
+                / weight_sum;
+            assert!((result[i].unwrap() - expected).abs() < 1e-9);
+        }
+    }
+
     #[test]
     fn test_ema() {
         let values = vec![1.0, 2.0, 3.0, 4.0, 5.0];
@@ -8,8 +8,11 @@
 
 use anyhow::Result;
 use clap::{Parser, Subcommand};
+use std::io::BufWriter;
 use std::path::PathBuf;
 use tracing::info;
+use tracing_appender::non_blocking::{NonBlockingBuilder, WorkerGuard};
+use tracing_subscriber::fmt::writer::BoxMakeWriter;
 use tracing_subscriber::{layer::SubscriberExt, util::SubscriberInitExt, EnvFilter};
 
 mod commands;
@@ -161,7 +164,14 @@ enum Commands {
     },
 }
 
-fn setup_logging(verbose: bool, command_name: &str, file_only: bool) -> Result<()> {
+/// Lines each background log writer may queue before callers wait for it to drain
+const LOG_QUEUE_LINES: usize = 10_000;
+
+/// Install the global subscriber
+///
+/// The returned guards flush buffered output when dropped, so keep them alive
+/// for the whole run.
+fn setup_logging(verbose: bool, command_name: &str, file_only: bool) -> Result<Vec<WorkerGuard>> {
     // Create logs directory
     std::fs::create_dir_all("logs")?;
 
@@ -182,8 +192,16 @@ fn setup_logging(verbose: bool, command_name: &str, file_only: bool) -> Result<(
     let env_filter =
         EnvFilter::try_from_default_env().unwrap_or_else(|_| EnvFilter::new(&filter_str));
 
-    // File appender
-    let file_appender = tracing_appender::rolling::never("logs", &log_filename);
+    // File appender: one handle, buffered, written by a worker thread that flushes
+    // whenever it drains its queue rather than issuing a write per event
+    let (file_appender, file_guard) = NonBlockingBuilder::default()
+        .buffered_lines_limit(LOG_QUEUE_LINES)
+        .lossy(false)
+        .finish(BufWriter::new(tracing_appender::rolling::never(
+            "logs",
+            &log_filename,
+        )));
+    let mut guards = vec![file_guard];
 
     if file_only {
         // For optimizer: only log to file, keep console clean for progress bar
@@ -199,9 +217,24 @@ fn setup_logging(verbose: bool, command_name: &str, file_only: bool) -> Result<(
             .with(file_layer)
             .init();
     } else {
+        // The live loop reports only through tracing, so its console output can be
+        // written off the trading path too; other commands interleave logs with
+        // println! output and keep writing to stdout directly to preserve ordering
+        let console_writer = if command_name == "live" {
+            let (writer, guard) = NonBlockingBuilder::default()
+                .buffered_lines_limit(LOG_QUEUE_LINES)
+                .lossy(false)
+                .finish(std::io::stdout());
+            guards.push(guard);
+            BoxMakeWriter::new(writer)
+        } else {
+            BoxMakeWriter::new(std::io::stdout)
+        };
+
         // Console layer with custom format matching Python:
         // %(asctime)s %(levelname)-8s [%(funcName)s:%(lineno)d] %(message)s
         let console_layer = tracing_subscriber::fmt::layer()
+            .with_writer(console_writer)
             .with_target(true)
             .with_thread_ids(false)
             .with_thread_names(false)
@@ -228,13 +261,13 @@ fn setup_logging(verbose: bool, command_name: &str, file_only: bool) -> Result<(
         info!("Log file: {}", log_path.display());
     }
 
-    Ok(())
+    Ok(guards)
 }
 
 #[tokio::main]
 async fn main() -> Result<()> {
-    // Load environment variables from .env file (checks current dir and parents)
-    // This allows API keys to be stored in .env at project root
+    // Load .env (current dir and parents) before logging is set up, so settings
+    // like RUST_LOG in it take effect as well as the API keys
     if let Err(e) = dotenv::dotenv() {
         // Not an error if .env doesn't exist - keys may be set via environment
         eprintln!("Note: .env file not found or unreadable: {}", e);
@@ -251,7 +284,7 @@ async fn main() -> Result<()> {
     };
 
     // Setup logging
-    setup_logging(cli.verbose, command_name, file_only)?;
+    let _log_guards = setup_logging(cli.verbose, command_name, file_only)?;
 
     // Execute command
     match cli.command {
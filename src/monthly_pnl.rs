@@ -5,6 +5,7 @@
 
 use chrono::{DateTime, Datelike, Utc};
 use std::collections::BTreeMap;
+use std::fmt::{self, Write};
 
 use crate::Trade;
 
@@ -37,7 +38,10 @@ impl MonthlyPnL {
         } else {
             self.losing_trades += 1;
         }
+    }
 
+    /// Derive the win rate once all of the month's trades are in
+    fn finalize(&mut self) {
         self.win_rate = if self.trade_count > 0 {
             (self.winning_trades as f64 / self.trade_count as f64) * 100.0
         } else {
@@ -84,13 +88,18 @@ impl MonthlyPnLMatrix {
                 .add_trade(trade);
         }
 
+        for pnl in data.values_mut() {
+            pnl.finalize();
+        }
+
         Self { data }
     }
 
     /// Get unique years in the data
+    ///
+    /// Keys are already ordered by (year, month), so duplicates are adjacent.
     fn years(&self) -> Vec<i32> {
         let mut years: Vec<i32> = self.data.keys().map(|ym| ym.year).collect();
-        years.sort();
         years.dedup();
         years
     }
@@ -101,14 +110,28 @@ impl MonthlyPnLMatrix {
     }
 
     /// Calculate yearly total P&L
+    ///
+    /// Keys are ordered by (year, month), so a range query visits only that year's months.
     fn yearly_total(&self, year: i32) -> f64 {
         self.data
-            .iter()
-            .filter(|(ym, _)| ym.year == year)
+            .range(YearMonth::new(year, 1)..=YearMonth::new(year, 12))
             .map(|(_, pnl)| pnl.net_pnl)
             .sum()
     }
 
+    /// Count (profitable, losing) months in a single pass
+    fn month_counts(&self) -> (usize, usize) {
+        self.data
+            .values()
+            .fold((0, 0), |(profitable, losing), pnl| {
+                if pnl.net_pnl > 0.0 {
+                    (profitable + 1, losing)
+                } else {
+                    (profitable, losing + 1)
+                }
+            })
+    }
+
     /// Calculate total P&L across all months
     pub fn total_pnl(&self) -> f64 {
         self.data.values().map(|pnl| pnl.net_pnl).sum()
@@ -121,46 +144,70 @@ impl MonthlyPnLMatrix {
         }
 
         let years = self.years();
-        let mut output = String::new();
+        let mut output = String::with_capacity(Self::render_capacity(&years));
+        self.write_plain(&mut output, &years)
+            .expect("writing to a String cannot fail");
+        output
+    }
+
+    /// Render with ANSI color codes for terminal display
+    pub fn render_colored(&self) -> String {
+        if self.data.is_empty() {
+            return "No trades to display monthly P&L matrix.".to_string();
+        }
+
+        let years = self.years();
+        let mut output = String::with_capacity(Self::render_capacity(&years));
+        self.write_colored(&mut output, &years)
+            .expect("writing to a String cannot fail");
+        output
+    }
+
+    /// Rough output size: fixed header/footer plus one ~160 byte row per year
+    fn render_capacity(years: &[i32]) -> usize {
+        1024 + years.len() * 160
+    }
+
+    /// Write the plain matrix straight into `out` (no per-cell temporaries)
+    fn write_plain(&self, out: &mut impl Write, years: &[i32]) -> fmt::Result {
+        let rule = "=".repeat(120);
 
         // Header
-        output.push_str(&format!("\n{}\n", "=".repeat(120)));
-        output.push_str("MONTHLY P&L MATRIX (₹)\n");
-        output.push_str(&format!("{}\n", "=".repeat(120)));
+        write!(out, "\n{}\n", rule)?;
+        out.write_str("MONTHLY P&L MATRIX (₹)\n")?;
+        writeln!(out, "{}", rule)?;
 
         // Column headers
-        output.push_str(&format!(
-            "{:>6} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>12}\n",
+        writeln!(
+            out,
+            "{:>6} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>12}",
             "Year", "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec", "Total"
-        ));
-        output.push_str(&format!("{}\n", "-".repeat(120)));
+        )?;
+        writeln!(out, "{}", "-".repeat(120))?;
 
         // Data rows (one per year)
-        for year in years {
-            output.push_str(&format!("{:>6} │", year));
+        for &year in years {
+            write!(out, "{:>6} │", year)?;
 
             // Monthly P&L values
             for month in 1..=12 {
-                let cell = if let Some(pnl) = self.get(year, month) {
-                    self.format_pnl_cell(pnl.net_pnl)
-                } else {
-                    "          ".to_string() // Empty cell
-                };
-                output.push_str(&format!(" {} │", cell));
+                match self.get(year, month) {
+                    Some(pnl) => write!(out, " {:>10.2} │", pnl.net_pnl)?,
+                    None => out.write_str("            │")?, // Empty cell
+                }
             }
 
             // Yearly total
-            let year_total = self.yearly_total(year);
-            output.push_str(&format!(" {:>12.2}\n", year_total));
+            writeln!(out, " {:>12.2}", self.yearly_total(year))?;
         }
 
-        output.push_str(&format!("{}\n", "=".repeat(120)));
+        writeln!(out, "{}", rule)?;
 
         // Summary statistics
-        output.push_str(&format!("Total P&L: ₹{:.2}\n", self.total_pnl()));
+        writeln!(out, "Total P&L: ₹{:.2}", self.total_pnl())?;
 
         // Count profitable vs losing months
-        let profitable_months = self.data.values().filter(|pnl| pnl.net_pnl > 0.0).count();
+        let (profitable_months, _) = self.month_counts();
         let total_months = self.data.len();
         let monthly_win_rate = if total_months > 0 {
             (profitable_months as f64 / total_months as f64) * 100.0
@@ -168,74 +215,68 @@ impl MonthlyPnLMatrix {
             0.0
         };
 
-        output.push_str(&format!(
-            "Monthly Win Rate: {:.1}% ({} profitable months / {} total months)\n",
+        writeln!(
+            out,
+            "Monthly Win Rate: {:.1}% ({} profitable months / {} total months)",
             monthly_win_rate, profitable_months, total_months
-        ));
-
-        output.push_str(&format!("{}\n", "=".repeat(120)));
+        )?;
 
-        output
+        writeln!(out, "{}", rule)
     }
 
-    /// Render with ANSI color codes for terminal display
-    pub fn render_colored(&self) -> String {
-        if self.data.is_empty() {
-            return "No trades to display monthly P&L matrix.".to_string();
-        }
-
+    /// Write the ANSI-colored matrix straight into `out`
+    fn write_colored(&self, out: &mut impl Write, years: &[i32]) -> fmt::Result {
         const GREEN: &str = "\x1b[32m";
         const RED: &str = "\x1b[31m";
         const RESET: &str = "\x1b[0m";
         const BOLD: &str = "\x1b[1m";
 
-        let years = self.years();
-        let mut output = String::new();
+        let rule = "=".repeat(120);
 
         // Header
-        output.push_str(&format!("\n{}{}{}\n", BOLD, "=".repeat(120), RESET));
-        output.push_str(&format!("{}MONTHLY P&L MATRIX (₹){}\n", BOLD, RESET));
-        output.push_str(&format!("{}{}{}\n", BOLD, "=".repeat(120), RESET));
+        write!(out, "\n{}{}{}\n", BOLD, rule, RESET)?;
+        writeln!(out, "{}MONTHLY P&L MATRIX (₹){}", BOLD, RESET)?;
+        writeln!(out, "{}{}{}", BOLD, rule, RESET)?;
 
         // Column headers
-        output.push_str(&format!(
-            "{}{:>6} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>12}{}\n",
+        writeln!(
+            out,
+            "{}{:>6} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>10} │ {:>12}{}",
             BOLD, "Year", "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec", "Total", RESET
-        ));
-        output.push_str(&format!("{}\n", "-".repeat(120)));
+        )?;
+        writeln!(out, "{}", "-".repeat(120))?;
 
         // Data rows (one per year)
-        for year in years {
-            output.push_str(&format!("{:>6} │", year));
+        for &year in years {
+            write!(out, "{:>6} │", year)?;
 
             // Monthly P&L values
             for month in 1..=12 {
-                let cell = if let Some(pnl) = self.get(year, month) {
-                    let color = if pnl.net_pnl > 0.0 { GREEN } else { RED };
-                    format!("{}{:>10.2}{}", color, pnl.net_pnl, RESET)
-                } else {
-                    "          ".to_string() // Empty cell
-                };
-                output.push_str(&format!(" {} │", cell));
+                match self.get(year, month) {
+                    Some(pnl) => {
+                        let color = if pnl.net_pnl > 0.0 { GREEN } else { RED };
+                        write!(out, " {}{:>10.2}{} │", color, pnl.net_pnl, RESET)?;
+                    }
+                    None => out.write_str("            │")?, // Empty cell
+                }
             }
 
             // Yearly total
             let year_total = self.yearly_total(year);
             let color = if year_total > 0.0 { GREEN } else { RED };
-            output.push_str(&format!(" {}{:>12.2}{}\n", color, year_total, RESET));
+            writeln!(out, " {}{:>12.2}{}", color, year_total, RESET)?;
         }
 
-        output.push_str(&format!("{}\n", "=".repeat(120)));
+        writeln!(out, "{}", rule)?;
 
         // Summary statistics
         let total = self.total_pnl();
         let color = if total > 0.0 { GREEN } else { RED };
-        output.push_str(&format!("{}Total P&L: ₹{:.2}{}\n", BOLD, total, RESET));
-        output.push_str(&format!("{color}         : ₹{total:.2}{RESET}\n"));
+        writeln!(out, "{}Total P&L: ₹{:.2}{}", BOLD, total, RESET)?;
+        writeln!(out, "{color}         : ₹{total:.2}{RESET}")?;
 
         // Count profitable vs losing months
-        let profitable_months = self.data.values().filter(|pnl| pnl.net_pnl > 0.0).count();
-        let losing_months = self.data.values().filter(|pnl| pnl.net_pnl <= 0.0).count();
+        let (profitable_months, losing_months) = self.month_counts();
         let total_months = self.data.len();
         let monthly_win_rate = if total_months > 0 {
             (profitable_months as f64 / total_months as f64) * 100.0
@@ -243,19 +284,13 @@ impl MonthlyPnLMatrix {
             0.0
         };
 
-        output.push_str(&format!(
-            "{}Monthly Win Rate: {:.1}% ({} profitable / {} losing / {} total months){}\n",
+        writeln!(
+            out,
+            "{}Monthly Win Rate: {:.1}% ({} profitable / {} losing / {} total months){}",
             BOLD, monthly_win_rate, profitable_months, losing_months, total_months, RESET
-        ));
-
-        output.push_str(&format!("{}\n", "=".repeat(120)));
+        )?;
 
-        output
-    }
-
-    /// Format a P&L value for a cell (right-aligned, 10 chars)
-    fn format_pnl_cell(&self, value: f64) -> String {
-        format!("{:>10.2}", value)
+        writeln!(out, "{}", rule)
     }
 }
 
@@ -339,6 +374,20 @@ mod tests {
         assert_eq!(matrix.total_pnl(), 4000.0);
     }
 
+    #[test]
+    fn test_month_counts() {
+        let trades = vec![
+            create_test_trade(2024, 1, 15, 1000.0),
+            create_test_trade(2024, 2, 15, -200.0),
+            create_test_trade(2024, 3, 15, 300.0),
+            create_test_trade(2024, 3, 20, -300.0),
+        ];
+
+        let matrix = MonthlyPnLMatrix::from_trades(&trades);
+        // March nets to zero, which counts as a losing month
+        assert_eq!(matrix.month_counts(), (1, 2));
+    }
+
     #[test]
     fn test_empty_trades() {
         let trades: Vec<Trade> = vec![];
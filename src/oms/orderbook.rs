@@ -141,7 +141,12 @@ impl OrderBook {
 
     /// Get all active orders
     pub fn get_all_orders(&self) -> Vec<&Order> {
-        self.orders.values().collect()
+        self.orders().collect()
+    }
+
+    /// Iterate over all active orders without collecting them
+    pub fn orders(&self) -> impl Iterator<Item = &Order> {
+        self.orders.values()
     }
 
     /// Update order state to filled
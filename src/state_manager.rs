@@ -8,7 +8,11 @@ use anyhow::{Context, Result};
 use chrono::Utc;
 use rusqlite::{params, Connection};
 use serde::{Deserialize, Serialize};
+use std::collections::hash_map::DefaultHasher;
 use std::collections::HashMap;
+use std::fs::File;
+use std::hash::Hasher;
+use std::io::{self, BufWriter, Write};
 use std::path::{Path, PathBuf};
 use std::sync::{Arc, Mutex};
 use tracing::{debug, info};
@@ -98,6 +102,29 @@ pub struct PendingOrder {
     pub client_id: Option<String>,
 }
 
+/// Borrowed view of the state written by `export_json`
+#[derive(Serialize)]
+struct StateExport<'a> {
+    checkpoint: &'a Option<Checkpoint>,
+    exported_at: String,
+    pending_orders: &'a [PendingOrder],
+    positions: &'a [Position],
+}
+
+/// `io::Write` sink that feeds serialized bytes into a hasher
+struct HashWriter(DefaultHasher);
+
+impl Write for HashWriter {
+    fn write(&mut self, buf: &[u8]) -> io::Result<usize> {
+        Hasher::write(&mut self.0, buf);
+        Ok(buf.len())
+    }
+
+    fn flush(&mut self) -> io::Result<()> {
+        Ok(())
+    }
+}
+
 // =============================================================================
 // State Manager Implementation
 // =============================================================================
@@ -107,6 +134,8 @@ pub struct SqliteStateManager {
     db_path: PathBuf,
     json_backup_path: PathBuf,
     auto_backup: bool,
+    /// Hash of the last exported state, so unchanged state is not rewritten
+    last_export_hash: Mutex<Option<u64>>,
 }
 
 impl SqliteStateManager {
@@ -133,6 +162,7 @@ impl SqliteStateManager {
             db_path: db_path_ref.to_path_buf(),
             json_backup_path: json_backup_path.as_ref().to_path_buf(),
             auto_backup,
+            last_export_hash: Mutex::new(None),
         };
 
         manager.create_tables()?;
@@ -251,7 +281,16 @@ impl SqliteStateManager {
     }
 
     pub fn save_position(&self, pos: &Position) -> Result<()> {
-        let conn = self.conn.lock().unwrap();
+        Self::write_position(&self.conn.lock().unwrap(), pos)?;
+
+        if self.auto_backup {
+            self.export_json()?;
+        }
+
+        Ok(())
+    }
+
+    fn write_position(conn: &Connection, pos: &Position) -> Result<()> {
         let metadata_json = serde_json::to_string(&pos.metadata)?;
 
         conn.execute(
@@ -282,11 +321,6 @@ impl SqliteStateManager {
             pos.symbol, pos.status, pos.quantity, pos.entry_price
         );
 
-        if self.auto_backup {
-            drop(conn);
-            self.export_json()?;
-        }
-
         Ok(())
     }
 
@@ -358,7 +392,16 @@ impl SqliteStateManager {
     }
 
     pub fn save_checkpoint(&self, ckpt: &Checkpoint) -> Result<()> {
-        let conn = self.conn.lock().unwrap();
+        Self::write_checkpoint(&self.conn.lock().unwrap(), ckpt)?;
+
+        if self.auto_backup {
+            self.export_json()?;
+        }
+
+        Ok(())
+    }
+
+    fn write_checkpoint(conn: &Connection, ckpt: &Checkpoint) -> Result<()> {
         let symbols_json = serde_json::to_string(&ckpt.last_processed_symbols)?;
         let metadata_json = serde_json::to_string(&ckpt.metadata)?;
 
@@ -389,11 +432,6 @@ impl SqliteStateManager {
             ckpt.cycle_count, ckpt.portfolio_value
         );
 
-        if self.auto_backup {
-            drop(conn);
-            self.export_json()?;
-        }
-
         Ok(())
     }
 
@@ -491,7 +529,10 @@ impl SqliteStateManager {
 
     /// Save a pending order to the database
     pub fn save_pending_order(&self, order: &PendingOrder) -> Result<()> {
-        let conn = self.conn.lock().unwrap();
+        Self::write_pending_order(&self.conn.lock().unwrap(), order)
+    }
+
+    fn write_pending_order(conn: &Connection, order: &PendingOrder) -> Result<()> {
         conn.execute(
             "INSERT OR REPLACE INTO pending_orders 
              (order_id, symbol, side, order_type, quantity, limit_price, stop_price, client_id)
@@ -553,26 +594,81 @@ impl SqliteStateManager {
         Ok(())
     }
 
+    /// Write the JSON backup, skipped when the state is unchanged since the last export
     pub fn export_json(&self) -> Result<()> {
         let positions = self.load_positions(None)?;
         let checkpoint = self.load_checkpoint()?;
         let pending_orders = self.load_pending_orders()?;
 
-        let state = serde_json::json!({
-            "exported_at": Utc::now().to_rfc3339(),
-            "positions": positions,
-            "checkpoint": checkpoint,
-            "pending_orders": pending_orders,
-        });
+        // Dirty check: hash the serialized state (without the export timestamp)
+        let mut hasher = HashWriter(DefaultHasher::new());
+        serde_json::to_writer(&mut hasher, &(&checkpoint, &pending_orders, &positions))?;
+        let state_hash = hasher.0.finish();
+        let mut last_export_hash = self.last_export_hash.lock().unwrap();
+        if *last_export_hash == Some(state_hash) {
+            debug!("State unchanged, skipping export");
+            return Ok(());
+        }
 
-        std::fs::write(
-            &self.json_backup_path,
-            serde_json::to_string_pretty(&state)?,
-        )?;
+        // Serialize borrowed data straight into a buffered file: no intermediate
+        // JSON value tree or full-document String
+        let state = StateExport {
+            checkpoint: &checkpoint,
+            exported_at: Utc::now().to_rfc3339(),
+            pending_orders: &pending_orders,
+            positions: &positions,
+        };
+
+        // Write a sibling temp file and rename it over the backup, so a crash
+        // mid-export leaves the previous backup intact rather than a torn file
+        let tmp_path = self.json_backup_path.with_extension("json.tmp");
+        let mut writer = BufWriter::new(File::create(&tmp_path)?);
+        serde_json::to_writer_pretty(&mut writer, &state)?;
+        writer.flush()?;
+        writer.get_ref().sync_all()?;
+        drop(writer);
+        std::fs::rename(&tmp_path, &self.json_backup_path).with_context(|| {
+            format!(
+                "Failed to replace state backup: {}",
+                self.json_backup_path.display()
+            )
+        })?;
+        *last_export_hash = Some(state_hash);
         debug!("State exported to: {}", self.json_backup_path.display());
         Ok(())
     }
 
+    /// Save a checkpoint with its open positions and pending orders in one transaction
+    ///
+    /// Either every row lands or none does, and the JSON backup is exported once
+    /// afterwards rather than once per row.
+    pub fn save_checkpoint_state(
+        &self,
+        ckpt: &Checkpoint,
+        positions: &[Position],
+        pending_orders: &[PendingOrder],
+    ) -> Result<()> {
+        {
+            let mut conn = self.conn.lock().unwrap();
+            let tx = conn.transaction()?;
+            Self::write_checkpoint(&tx, ckpt)?;
+            for pos in positions {
+                Self::write_position(&tx, pos)?;
+            }
+            tx.execute("DELETE FROM pending_orders", [])?;
+            for order in pending_orders {
+                Self::write_pending_order(&tx, order)?;
+            }
+            tx.commit()?;
+        }
+
+        if self.auto_backup {
+            self.export_json()?;
+        }
+
+        Ok(())
+    }
+
     // Async wrappers for use in async contexts (like live trading)
     pub async fn save_checkpoint_async(
         &self,
@@ -634,13 +730,15 @@ impl SqliteStateManager {
     }
 
     fn clone_for_async(&self) -> Self {
-        // Create a new state manager with the same paths
-        SqliteStateManager::new(
-            self.db_path.clone(),
-            self.json_backup_path.clone(),
-            false, // Don't auto-export for clones
-        )
-        .expect("Failed to clone state manager")
+        // Share the already-open connection: directories, pragmas and tables were
+        // set up once in `new`, so there is nothing to redo per write
+        Self {
+            conn: Arc::clone(&self.conn),
+            db_path: self.db_path.clone(),
+            json_backup_path: self.json_backup_path.clone(),
+            auto_backup: false, // Don't auto-export for clones
+            last_export_hash: Mutex::new(None),
+        }
     }
 }
 
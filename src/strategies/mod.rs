@@ -159,7 +159,7 @@ pub fn create_strategy(config: &Config) -> Result<Box<dyn Strategy>> {
     let registry = get_registry().read().unwrap();
 
     let strategy_name = config.strategy_name();
-    let factory = registry.get(strategy_name.as_str()).ok_or_else(|| {
+    let factory = registry.get(strategy_name).ok_or_else(|| {
         let available: Vec<_> = registry.keys().copied().collect();
         anyhow::anyhow!(
             "Unknown strategy: '{}'. Available: {}",
@@ -24,7 +24,7 @@ pub enum MomentumState {
 
 /// Create strategy from config (called by registry)
 pub fn create(config: &Config) -> Result<Box<dyn Strategy>> {
-    let strategy_config: MomentumScalperConfig = serde_json::from_value(config.strategy.clone())
+    let strategy_config: MomentumScalperConfig = Deserialize::deserialize(&config.strategy)
         .map_err(|e| anyhow::anyhow!("Failed to parse momentum_scalper config: {}", e))?;
     Ok(Box::new(MomentumScalperStrategy::new(strategy_config)))
 }
@@ -10,10 +10,11 @@ pub use strategy::QuickFlipStrategy;
 
 use crate::{Config, Strategy};
 use anyhow::Result;
+use serde::Deserialize;
 
 /// Create strategy from config (called by registry)
 pub fn create(config: &Config) -> Result<Box<dyn Strategy>> {
-    let strategy_config: QuickFlipConfig = serde_json::from_value(config.strategy.clone())
+    let strategy_config: QuickFlipConfig = Deserialize::deserialize(&config.strategy)
         .map_err(|e| anyhow::anyhow!("Failed to parse quick_flip config: {}", e))?;
     Ok(Box::new(QuickFlipStrategy::new(strategy_config)))
 }
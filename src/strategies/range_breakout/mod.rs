@@ -21,7 +21,7 @@ pub enum BreakoutType {
 
 /// Create strategy from config (called by registry)
 pub fn create(config: &Config) -> Result<Box<dyn Strategy>> {
-    let strategy_config: RangeBreakoutConfig = serde_json::from_value(config.strategy.clone())
+    let strategy_config: RangeBreakoutConfig = Deserialize::deserialize(&config.strategy)
         .map_err(|e| anyhow::anyhow!("Failed to parse range_breakout config: {}", e))?;
     Ok(Box::new(RangeBreakoutStrategy::new(strategy_config)))
 }
@@ -57,11 +57,17 @@ impl Indicators {
 /// Uses batch indicator calculation matching main branch for proven results.
 pub struct VolatilityRegimeStrategy {
     config: VolatilityRegimeConfig,
+    /// Minimum candles before indicators are valid (fixed for a given config)
+    min_warmup: usize,
 }
 
 impl VolatilityRegimeStrategy {
     pub fn new(config: VolatilityRegimeConfig) -> Self {
-        Self { config }
+        // Warmup matching main branch, resolved once instead of per signal
+        let min_warmup = (config.atr_period + 2 * config.adx_period)
+            .max(config.atr_period + config.volatility_lookback)
+            .max(config.ema_slow);
+        Self { config, min_warmup }
     }
 
     /// Classify volatility regime
@@ -75,16 +81,17 @@ impl VolatilityRegimeStrategy {
         let lookback_start = candles
             .len()
             .saturating_sub(self.config.volatility_lookback);
-        let lookback_atrs: Vec<f64> = ind.atr_values[lookback_start..]
+        // Mean over the lookback without materializing it (runs every bar)
+        let (atr_sum, atr_count) = ind.atr_values[lookback_start..]
             .iter()
-            .filter_map(|&x| x)
-            .collect();
+            .flatten()
+            .fold((0.0, 0usize), |(sum, count), &x| (sum + x, count + 1));
 
-        if lookback_atrs.is_empty() {
+        if atr_count == 0 {
             return None;
         }
 
-        let atr_mean: f64 = lookback_atrs.iter().sum::<f64>() / lookback_atrs.len() as f64;
+        let atr_mean = atr_sum / atr_count as f64;
         if atr_mean == 0.0 {
             return Some(VolatilityRegime::Normal);
         }
@@ -152,11 +159,7 @@ impl Strategy for VolatilityRegimeStrategy {
         let mut orders = Vec::new();
 
         // Minimum warmup check matching main branch
-        let min_warmup = (self.config.atr_period + 2 * self.config.adx_period)
-            .max(self.config.atr_period + self.config.volatility_lookback)
-            .max(self.config.ema_slow);
-
-        if candles.len() < min_warmup {
+        if candles.len() < self.min_warmup {
             return orders;
         }
 